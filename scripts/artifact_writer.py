@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Incremental, atomic artifact writes shared by the exporters
+Each artifact is serialized once in memory and compared by hash with the file
+already on disk; it is only rewritten (temp file + os.replace) when it differs,
+so unchanged artifacts keep their bytes and mtime. Also holds the canonical
+content hashes used for manifest.json and cache keys.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from collections import Counter
+
+# Top-level keys excluded from content hashes, so unchanged data keeps its hash
+# (and glossary.json keeps its last_updated) across exports
+TIMESTAMP_KEYS = {'last_updated', 'generated', 'content_hash'}
+
+# 'written' / 'unchanged' / 'removed' totals since the last reset_write_counts()
+write_counts = Counter()
+
+# filename → content hash of its bytes, for every artifact passed through this module
+# (written or unchanged) since the last reset_write_counts(); feeds manifest.json
+file_hashes = {}
+
+
+def reset_write_counts():
+    write_counts.clear()
+    file_hashes.clear()
+
+
+def content_hash(data_bytes: bytes) -> str:
+    """Short content hash used for cache keys (first 16 hex chars of SHA-256)"""
+    return hashlib.sha256(data_bytes).hexdigest()[:16]
+
+
+def strip_timestamps(data):
+    """Drop top-level timestamp keys (and the stored hash) before hashing"""
+    if isinstance(data, dict):
+        return {k: v for k, v in data.items() if k not in TIMESTAMP_KEYS}
+    return data
+
+
+def canonical_hash(data) -> str:
+    """Content hash over canonical JSON (sorted keys, no whitespace, no timestamps)"""
+    canonical = json.dumps(strip_timestamps(data), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return content_hash(canonical.encode('utf-8'))
+
+
+def json_bytes(data, minified: bool = False) -> bytes:
+    """Serialize exactly as the exporters always have (indent=2) or minified"""
+    if minified:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def file_matches(filename: str, data_bytes: bytes, digest: bytes = None) -> bool:
+    """True if the file on disk already holds exactly these bytes"""
+    try:
+        if os.path.getsize(filename) != len(data_bytes):
+            return False
+        with open(filename, 'rb') as f:
+            on_disk = hashlib.sha256(f.read()).digest()
+    except OSError:
+        return False
+    return on_disk == (digest or hashlib.sha256(data_bytes).digest())
+
+
+def _record_hash(filename: str, data_bytes: bytes) -> bytes:
+    digest = hashlib.sha256(data_bytes)
+    file_hashes[filename] = digest.hexdigest()[:16]
+    return digest.digest()
+
+
+def record_existing(filename: str) -> bool:
+    """Hash a published file this run didn't need to touch, so it stays in the manifest"""
+    try:
+        with open(filename, 'rb') as f:
+            _record_hash(filename, f.read())
+    except OSError:
+        return False
+    return True
+
+
+def write_bytes(filename: str, data_bytes: bytes) -> bool:
+    """Atomically write data_bytes unless the file is already identical; returns True if written"""
+    if file_matches(filename, data_bytes, _record_hash(filename, data_bytes)):
+        write_counts['unchanged'] += 1
+        return False
+
+    tmp_name = f"{filename}.tmp"
+    with open(tmp_name, 'wb') as f:
+        f.write(data_bytes)
+    os.replace(tmp_name, filename)
+    write_counts['written'] += 1
+    return True
+
+
+def write_json(filename: str, data, minified: bool = False) -> int:
+    """Serialize once, write if changed, log the result; returns the size in bytes"""
+    return write_json_bytes(filename, json_bytes(data, minified))
+
+
+def write_json_bytes(filename: str, data_bytes: bytes) -> int:
+    """write_json for bytes already serialized with json_bytes(), so callers can reuse them"""
+    if write_bytes(filename, data_bytes):
+        print(f"✅ Created {filename} ({len(data_bytes)} bytes)")
+    else:
+        print(f"⏭️  Unchanged {filename} ({len(data_bytes)} bytes)")
+    return len(data_bytes)
+
+
+def replace_if_changed(tmp_name: str, filename: str) -> bool:
+    """Move a fully built temp file into place unless the target is byte-identical"""
+    with open(tmp_name, 'rb') as f:
+        data_bytes = f.read()
+    if file_matches(filename, data_bytes, _record_hash(filename, data_bytes)):
+        os.remove(tmp_name)
+        write_counts['unchanged'] += 1
+        return False
+    os.replace(tmp_name, filename)
+    write_counts['written'] += 1
+    return True
+
+
+def remove_stale_files(directory: str, keep, pattern: str = '*.json') -> int:
+    """Delete files in directory matching pattern that aren't in keep (paths as written)"""
+    keep = {os.path.normpath(filename) for filename in keep}
+    removed = 0
+    for filename in sorted(glob.glob(os.path.join(directory, pattern))):
+        if os.path.normpath(filename) not in keep:
+            os.remove(filename)
+            print(f"🗑️  Removed {filename}")
+            removed += 1
+    write_counts['removed'] += removed
+    return removed
+
+
+def print_write_summary():
+    """One line: how many artifacts were rewritten, left untouched or removed"""
+    summary = f"📝 {write_counts['written']} artifacts written, {write_counts['unchanged']} unchanged"
+    if write_counts['removed']:
+        summary += f", {write_counts['removed']} removed"
+    print(summary)
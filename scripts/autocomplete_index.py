@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Prefix autocomplete index over term names, abbreviations and tags
+Built at export time as a sorted key array so a prefix maps to one
+contiguous, binary-searchable range instead of a scan over every name
+"""
+
+import heapq
+import json
+from bisect import bisect_left
+from typing import Dict, List
+
+# Ranking tiers: lower is better
+TIER_NAME = 0          # full US/UK name
+TIER_ABBREVIATION = 1  # abbreviation or ID
+TIER_WORD = 2          # a later word inside a name ("stitch" in "chain stitch")
+TIER_TAG = 3           # tag
+
+DEFAULT_LIMIT = 10
+
+# Prefixes this short span most of the key array, so their top completions
+# are ranked once at load time instead of on every keystroke
+SHORT_PREFIX_LENGTH = 2
+SHORT_PREFIX_LIMIT = 50
+
+
+def build_autocomplete_index(terms: List[Dict]) -> Dict:
+    """Build the sorted-array autocomplete structure written to autocomplete.json"""
+    entries = {}  # (key, term position) -> best tier
+
+    def add(text, position, tier):
+        key = text.strip().lower() if text else ''
+        if key and tier < entries.get((key, position), TIER_TAG + 1):
+            entries[(key, position)] = tier
+
+    for position, term in enumerate(terms):
+        for field in ('name_us', 'name_uk'):
+            name = term.get(field, '')
+            add(name, position, TIER_NAME)
+
+            # Index every later word start so "stitch" completes "Chain Stitch"
+            words = name.lower().split()
+            for i in range(1, len(words)):
+                add(' '.join(words[i:]), position, TIER_WORD)
+
+        add(term.get('id'), position, TIER_ABBREVIATION)
+        for field in ('abbreviation_us', 'abbreviation_uk'):
+            add(term.get(field), position, TIER_ABBREVIATION)
+        for tag in term.get('tags', []):
+            add(tag, position, TIER_TAG)
+
+    ordered = sorted(entries.items())
+    return {
+        "version": "1.0",
+        "ids": [term['id'] for term in terms],
+        "names": [term.get('name_us', '') for term in terms],
+        "keys": [key for (key, _), _ in ordered],
+        "refs": [position for (_, position), _ in ordered],
+        "tiers": [tier for _, tier in ordered],
+    }
+
+
+class AutocompleteIndex:
+    """Query API over a built autocomplete structure"""
+
+    def __init__(self, data: Dict):
+        self.ids = data['ids']
+        self.names = data['names']
+        self.keys = data['keys']
+        self.refs = data['refs']
+        self.tiers = data['tiers']
+        self.short_prefixes = self._rank_short_prefixes()
+
+    def _rank_short_prefixes(self) -> Dict[str, List[Dict]]:
+        """Top SHORT_PREFIX_LIMIT completions for every key prefix up to SHORT_PREFIX_LENGTH"""
+        prefixes = {key[:length] for key in self.keys for length in range(1, SHORT_PREFIX_LENGTH + 1)}
+        ranked = {}
+        for prefix in prefixes:
+            start, end = self.prefix_range(prefix)
+            ranked[prefix] = self._complete_slow(prefix, start, end, SHORT_PREFIX_LIMIT)
+        return ranked
+
+    @classmethod
+    def from_terms(cls, terms: List[Dict]) -> 'AutocompleteIndex':
+        """Build directly from term dicts"""
+        return cls(build_autocomplete_index(terms))
+
+    @classmethod
+    def from_file(cls, path: str = 'autocomplete.json') -> 'AutocompleteIndex':
+        """Load the exported autocomplete.json"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def prefix_range(self, prefix: str):
+        """Return the [start, end) slice of keys beginning with prefix"""
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', lo=start)
+        return start, end
+
+    def complete(self, prefix: str, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        """Return the top completions for a prefix, one per term"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        if len(prefix) <= SHORT_PREFIX_LENGTH and limit <= SHORT_PREFIX_LIMIT:
+            return [dict(match) for match in self.short_prefixes.get(prefix, [])[:limit]]
+
+        start, end = self.prefix_range(prefix)
+
+        # Exact key matches first, then by tier, then shortest key
+        ranked = heapq.nsmallest(
+            limit * 4,
+            range(start, end),
+            key=lambda i: (self.keys[i] != prefix, self.tiers[i], len(self.keys[i]), self.keys[i]),
+        )
+
+        results = []
+        seen = set()
+        for i in ranked:
+            position = self.refs[i]
+            if position in seen:
+                continue
+            seen.add(position)
+            results.append({
+                "id": self.ids[position],
+                "name_us": self.names[position],
+                "match": self.keys[i],
+            })
+            if len(results) >= limit:
+                break
+
+        # Rare: many keys of one term crowded out the candidate pool
+        if len(results) < limit and len(ranked) < end - start:
+            return self._complete_slow(prefix, start, end, limit)
+        return results
+
+    def _complete_slow(self, prefix: str, start: int, end: int, limit: int) -> List[Dict]:
+        """Fallback that ranks the whole prefix range"""
+        best = {}
+        for i in range(start, end):
+            rank = (self.keys[i] != prefix, self.tiers[i], len(self.keys[i]), self.keys[i])
+            position = self.refs[i]
+            if position not in best or rank < best[position][0]:
+                best[position] = (rank, i)
+
+        ordered = sorted(best.items(), key=lambda item: item[1][0])[:limit]
+        return [
+            {"id": self.ids[position], "name_us": self.names[position], "match": self.keys[i]}
+            for position, (_, i) in ordered
+        ]
+
+
+def main():
+    """Print sample completions from glossary.json"""
+    from glossary_index import load_glossary_terms
+
+    index = AutocompleteIndex.from_terms(load_glossary_terms('../glossary.json'))
+    print(f"✅ Built autocomplete index with {len(index.keys)} keys")
+    for prefix in ['s', 'sin', 'tun', 'amig', 'stitch']:
+        matches = ', '.join(m['id'] for m in index.complete(prefix, 5))
+        print(f"   🔍 {prefix!r} → {matches}")
+
+
+if __name__ == "__main__":
+    main()
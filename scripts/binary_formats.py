@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+MessagePack and CBOR versions of the JSON artifacts
+Same logical schema as the JSON files, smaller on the wire and faster to decode.
+Both encoders are optional: install msgpack and/or cbor2 to enable them.
+"""
+
+import json
+import os
+from typing import Dict, Iterable
+
+from artifact_writer import write_bytes, write_counts
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+BINARY_FORMATS = ('msgpack', 'cbor')
+
+# Artifacts that get binary siblings (glossary.json → glossary.msgpack / glossary.cbor)
+BINARY_ARTIFACTS = ('glossary.json', 'terms.json', 'categories.json', 'quiz.json')
+
+# Fastest-first decode order in CPython (see main() for the benchmark): msgpack
+# beats the json C decoder, while cbor2 is roughly on par with json
+LOAD_PREFERENCE = ('msgpack', 'json', 'cbor')
+
+
+def available_formats() -> list:
+    """Binary formats whose encoder library is installed"""
+    formats = []
+    if msgpack is not None:
+        formats.append('msgpack')
+    if cbor2 is not None:
+        formats.append('cbor')
+    return formats
+
+
+def encode(data, fmt: str) -> bytes:
+    """Encode data in a binary format"""
+    if fmt == 'msgpack':
+        return msgpack.packb(data, use_bin_type=True)
+    if fmt == 'cbor':
+        return cbor2.dumps(data)
+    raise ValueError(f"Unknown binary format '{fmt}'")
+
+
+def decode(data_bytes: bytes, fmt: str):
+    """Decode bytes written by encode()"""
+    if fmt == 'msgpack':
+        return msgpack.unpackb(data_bytes, raw=False)
+    if fmt == 'cbor':
+        return cbor2.loads(data_bytes)
+    if fmt == 'json':
+        return json.loads(data_bytes)
+    raise ValueError(f"Unknown format '{fmt}'")
+
+
+def write_binary_artifacts(files: Dict[str, object], formats: Iterable[str] = BINARY_FORMATS,
+                           artifacts: Iterable[str] = BINARY_ARTIFACTS) -> Dict[str, int]:
+    """Write binary siblings for the selected JSON artifacts; returns {filename: bytes}"""
+    installed = available_formats()
+    formats = [fmt for fmt in formats if fmt in installed]
+    missing = [fmt for fmt in BINARY_FORMATS if fmt not in installed]
+    if missing:
+        print(f"⚠️  Skipping {', '.join(missing)} output (pip install msgpack cbor2)")
+
+    written = {}
+    for filename, data in files.items():
+        if filename not in artifacts:
+            continue
+        base = os.path.splitext(filename)[0]
+        # A sibling left over from an export that had the encoder would be
+        # stale now, and load_artifact() would still prefer it over the JSON
+        for fmt in missing:
+            stale = f"{base}.{fmt}"
+            if os.path.exists(stale):
+                os.remove(stale)
+                write_counts['removed'] += 1
+                print(f"🗑️  Removed stale {stale}")
+        for fmt in formats:
+            data_bytes = encode(data, fmt)
+            out_name = f"{base}.{fmt}"
+            changed = write_bytes(out_name, data_bytes)
+            written[out_name] = len(data_bytes)
+            print(f"{'✅ Created' if changed else '⏭️  Unchanged'} {out_name} ({len(data_bytes)} bytes)")
+    return written
+
+
+def load_artifact(name: str, directory: str = '.'):
+    """Load an artifact by base name ("glossary"), using the fastest format on disk
+
+    Formats are tried in LOAD_PREFERENCE order, skipping any whose decoder is
+    not installed.
+    """
+    name = os.path.splitext(name)[0]
+    installed = available_formats() + ['json']
+    for fmt in [f for f in LOAD_PREFERENCE if f in installed]:
+        path = os.path.join(directory, f"{name}.{fmt}")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return decode(f.read(), fmt)
+    raise FileNotFoundError(f"No {name}.msgpack/.cbor/.json found in {directory}")
+
+
+def main():
+    """Compare artifact sizes and decode times across formats"""
+    import timeit
+
+    directory = '..'
+    print(f"Installed binary formats: {', '.join(available_formats()) or 'none'}")
+    for artifact in BINARY_ARTIFACTS:
+        path = os.path.join(directory, artifact)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            json_bytes = f.read()
+        data = json.loads(json_bytes)
+
+        print(f"\n📄 {artifact}")
+        for fmt in ['json'] + available_formats():
+            data_bytes = json_bytes if fmt == 'json' else encode(data, fmt)
+            seconds = timeit.timeit(lambda: decode(data_bytes, fmt), number=20) / 20
+            print(f"   {fmt:8} {len(data_bytes):>8,} bytes   decode {seconds * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
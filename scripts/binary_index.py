@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped, read-only binary term index (glossary.idx)
+Layout: fixed header, field-name table, id table sorted by id, fixed-size
+records of (offset, length) slots, then a deduplicated UTF-8 string pool.
+Readers mmap the file and decode a term only when it is looked up, so many
+worker processes share one page-cache copy and open it in constant time.
+"""
+
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, Union
+
+from artifact_writer import write_bytes
+
+BINARY_INDEX_FILE = 'glossary.idx'
+
+MAGIC = b'CGIX'
+FORMAT_VERSION = 1
+
+# magic, version, record size, term count, field count,
+# field table offset, id table offset, record offset, pool offset, pool size
+HEADER = struct.Struct('<4sHHIIIIIII')
+SLOT = struct.Struct('<II')            # (pool offset, byte length)
+ID_ENTRY = struct.Struct('<III')       # (id pool offset, id length, record offset)
+
+# Tags are stored as one pooled string joined with the ASCII unit separator
+TAG_SEPARATOR = '\x1f'
+
+
+def _encode_value(value) -> str:
+    if isinstance(value, list):
+        return TAG_SEPARATOR.join(str(v) for v in value)
+    return '' if value is None else str(value)
+
+
+def build_binary_index(terms: List[Dict], filename: str = BINARY_INDEX_FILE) -> int:
+    """Write glossary.idx for the given terms; returns its size in bytes"""
+    fields = []
+    for term in terms:
+        for field in term:
+            if field not in fields:
+                fields.append(field)
+
+    # Keep the first occurrence of each ID, like GlossaryIndex
+    unique_terms = {}
+    for term in terms:
+        if term.get('id'):
+            unique_terms.setdefault(term['id'], term)
+
+    pool = bytearray()
+    pooled: Dict[bytes, int] = {}
+
+    def intern(text: str):
+        data = text.encode('utf-8')
+        offset = pooled.get(data)
+        if offset is None:
+            offset = pooled[data] = len(pool)
+            pool.extend(data)
+        return offset, len(data)
+
+    field_table = b''.join(SLOT.pack(*intern(field)) for field in fields)
+
+    record_size = SLOT.size * len(fields)
+    records = bytearray()
+    entries = []
+    for term_id, term in unique_terms.items():
+        entries.append((term_id.encode('utf-8'), intern(term_id), len(records)))
+        for field in fields:
+            records.extend(SLOT.pack(*intern(_encode_value(term.get(field, '')))))
+
+    # Byte-wise sort matches the reader's binary search
+    entries.sort(key=lambda entry: entry[0])
+    id_table = b''.join(ID_ENTRY.pack(offset, length, record) for _, (offset, length), record in entries)
+
+    field_table_offset = HEADER.size
+    id_table_offset = field_table_offset + len(field_table)
+    records_offset = id_table_offset + len(id_table)
+    pool_offset = records_offset + len(records)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, record_size, len(entries), len(fields),
+                         field_table_offset, id_table_offset, records_offset, pool_offset, len(pool))
+
+    data_bytes = b''.join((header, field_table, id_table, bytes(records), bytes(pool)))
+    changed = write_bytes(filename, data_bytes)
+    print(f"{'✅ Created' if changed else '⏭️  Unchanged'} {filename} ({len(data_bytes)} bytes)")
+    return len(data_bytes)
+
+
+class BinaryIndexReader:
+    """Zero-copy reader: only the header is parsed on open"""
+
+    def __init__(self, filename: str = BINARY_INDEX_FILE):
+        with open(filename, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, record_size, self.term_count, self.field_count,
+         self._field_table, self._id_table, self._records, self._pool, pool_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a glossary binary index")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary index version {version}")
+        self._fields = None
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.term_count
+
+    def __contains__(self, term_id: str) -> bool:
+        return self._find(term_id.encode('utf-8')) is not None
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def _id_bytes(self, i: int):
+        offset, length, record = ID_ENTRY.unpack_from(self._mm, self._id_table + i * ID_ENTRY.size)
+        start = self._pool + offset
+        return self._mm[start:start + length], record
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Binary search the sorted id table; returns the record offset"""
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key, record = self._id_bytes(mid)
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                return record
+        return None
+
+    @property
+    def fields(self) -> List[str]:
+        """Field names, decoded on first use"""
+        if self._fields is None:
+            self._fields = [
+                self._string(*SLOT.unpack_from(self._mm, self._field_table + i * SLOT.size))
+                for i in range(self.field_count)
+            ]
+        return self._fields
+
+    @staticmethod
+    def _decode_value(field: str, value: str):
+        if field == 'tags':
+            return value.split(TAG_SEPARATOR) if value else []
+        return value
+
+    def _decode_record(self, record: int) -> Dict:
+        term = {}
+        base = self._records + record
+        for i, field in enumerate(self.fields):
+            term[field] = self._decode_value(field, self._string(*SLOT.unpack_from(self._mm, base + i * SLOT.size)))
+        return term
+
+    def get(self, term_id: str) -> Optional[Dict]:
+        """Decode one term by ID, or None"""
+        record = self._find(term_id.encode('utf-8'))
+        return self._decode_record(record) if record is not None else None
+
+    def get_field(self, term_id: str, field: str) -> Optional[Union[str, List[str]]]:
+        """Decode a single field of one term without building the whole dict (None if either is unknown)"""
+        if field not in self.fields:
+            return None
+        record = self._find(term_id.encode('utf-8'))
+        if record is None:
+            return None
+        i = self.fields.index(field)
+        return self._decode_value(field, self._string(*SLOT.unpack_from(self._mm, self._records + record + i * SLOT.size)))
+
+    def ids(self) -> Iterator[str]:
+        """All term IDs in sorted (byte) order"""
+        for i in range(self.term_count):
+            yield self._id_bytes(i)[0].decode('utf-8')
+
+
+def main():
+    """Build a throwaway index from glossary.json and time lookups"""
+    import os
+    import tempfile
+    import timeit
+
+    from glossary_index import load_glossary_terms
+
+    path = os.path.join(tempfile.mkdtemp(), BINARY_INDEX_FILE)
+    terms = load_glossary_terms('../glossary.json')
+    build_binary_index(terms, path)
+
+    open_seconds = timeit.timeit(lambda: BinaryIndexReader(path).close(), number=1000) / 1000
+    with BinaryIndexReader(path) as reader:
+        get_seconds = timeit.timeit(lambda: reader.get('SC'), number=10000) / 10000
+        print(f"   {len(reader)} terms, open {open_seconds * 1e6:.1f} µs, get {get_seconds * 1e6:.1f} µs")
+        print(f"   🔍 SC → {reader.get('SC')['name_us']}, tags {reader.get('SC')['tags']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Columnar (struct-of-arrays) glossary artifact
+One array per field instead of one dict per term: key strings appear once,
+category/difficulty/status are dictionary-encoded as small ints, and tags are
+an offsets + values pair. The loader hands out lazy row views instead of dicts.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Dict, List
+
+from artifact_writer import write_json
+
+COLUMNAR_FILE = 'glossary.columnar.json'
+
+# Low-cardinality fields stored as indexes into a per-field dictionary
+DICTIONARY_FIELDS = ('category', 'difficulty', 'status')
+
+
+def build_columnar(terms: List[Dict]) -> Dict:
+    """Convert term dicts into the columnar layout"""
+    fields = []
+    for term in terms:
+        for field in term:
+            if field not in fields:
+                fields.append(field)
+
+    columns = {}
+    dictionaries = {}
+    for field in fields:
+        if field == 'tags':
+            continue
+        values = [term.get(field, '') for term in terms]
+        if field in DICTIONARY_FIELDS:
+            dictionary, codes = _dictionary_encode(values)
+            dictionaries[field] = dictionary
+            columns[field] = codes
+        else:
+            columns[field] = values
+
+    # Tags: row i owns values[offsets[i]:offsets[i + 1]], each an index into the tag dictionary
+    tag_dictionary, tag_codes = _dictionary_encode([tag for term in terms for tag in term.get('tags', [])])
+    offsets = [0]
+    for term in terms:
+        offsets.append(offsets[-1] + len(term.get('tags', [])))
+
+    return {
+        "version": "1.0",
+        "format": "columnar",
+        "total_terms": len(terms),
+        "fields": fields,
+        "columns": columns,
+        "dictionaries": dictionaries,
+        "tags": {"dictionary": tag_dictionary, "offsets": offsets, "values": tag_codes},
+    }
+
+
+def _dictionary_encode(values: List[str]):
+    """Return (distinct values in first-seen order, code per value)"""
+    dictionary = []
+    codes_by_value = {}
+    codes = []
+    for value in values:
+        code = codes_by_value.get(value)
+        if code is None:
+            code = codes_by_value[value] = len(dictionary)
+            dictionary.append(value)
+        codes.append(code)
+    return dictionary, codes
+
+
+def write_columnar(terms: List[Dict], filename: str = COLUMNAR_FILE) -> int:
+    """Write the columnar artifact compactly; returns its size in bytes"""
+    return write_json(filename, build_columnar(terms), minified=True)
+
+
+class TermRow(Mapping):
+    """Read-only, lazily decoded view of one term in a ColumnarGlossary"""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'ColumnarGlossary', row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._table.value(self._row, field)
+
+    def __iter__(self):
+        return iter(self._table.fields)
+
+    def __len__(self):
+        return len(self._table.fields)
+
+    def __repr__(self):
+        return f"TermRow({self['id']!r})"
+
+    def to_dict(self) -> Dict:
+        """Materialize a plain dict in the original glossary.json shape"""
+        return {field: self[field] for field in self._table.fields}
+
+
+class ColumnarGlossary:
+    """Loader over the columnar artifact that returns lazy row views"""
+
+    def __init__(self, data: Dict):
+        self.fields = data['fields']
+        self.columns = data['columns']
+        self.dictionaries = data['dictionaries']
+        self.tag_dictionary = data['tags']['dictionary']
+        self.tag_offsets = data['tags']['offsets']
+        self.tag_values = data['tags']['values']
+        self.total_terms = data['total_terms']
+        self._row_by_id = None
+
+    @classmethod
+    def from_file(cls, path: str = COLUMNAR_FILE) -> 'ColumnarGlossary':
+        """Load glossary.columnar.json"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return self.total_terms
+
+    def __getitem__(self, row: int) -> TermRow:
+        if not -self.total_terms <= row < self.total_terms:
+            raise IndexError(row)
+        return TermRow(self, row % self.total_terms)
+
+    def __iter__(self):
+        return (TermRow(self, row) for row in range(self.total_terms))
+
+    def value(self, row: int, field: str):
+        """Decode a single cell"""
+        if field == 'tags':
+            start, end = self.tag_offsets[row], self.tag_offsets[row + 1]
+            return [self.tag_dictionary[code] for code in self.tag_values[start:end]]
+        if field not in self.columns:
+            raise KeyError(field)
+        cell = self.columns[field][row]
+        if field in self.dictionaries:
+            return self.dictionaries[field][cell]
+        return cell
+
+    def column(self, field: str) -> List:
+        """Decoded values of one field for every term"""
+        if field == 'tags':
+            return [self.value(row, 'tags') for row in range(self.total_terms)]
+        if field in self.dictionaries:
+            dictionary = self.dictionaries[field]
+            return [dictionary[code] for code in self.columns[field]]
+        return self.columns[field]
+
+    def get(self, term_id: str):
+        """Row view for a term ID, or None"""
+        if self._row_by_id is None:
+            self._row_by_id = {value: row for row, value in enumerate(self.columns['id'])}
+        row = self._row_by_id.get(term_id)
+        return TermRow(self, row) if row is not None else None
+
+
+def main():
+    """Compare the columnar artifact with glossary.json"""
+    import gc
+    import os
+    import tempfile
+    import time
+
+    from glossary_index import GlossaryIndex, load_glossary_terms
+
+    terms = load_glossary_terms('../glossary.json')
+    path = os.path.join(tempfile.mkdtemp(), COLUMNAR_FILE)
+    size = write_columnar(terms, path)
+
+    def count_objects(loader):
+        gc.collect()
+        before = len(gc.get_objects())
+        start = time.perf_counter()
+        result = loader()
+        elapsed = (time.perf_counter() - start) * 1000
+        return result, len(gc.get_objects()) - before, elapsed
+
+    _, row_objects, row_ms = count_objects(lambda: load_glossary_terms('../glossary.json'))
+    table, col_objects, col_ms = count_objects(lambda: ColumnarGlossary.from_file(path))
+
+    print(f"   glossary.json: {os.path.getsize('../glossary.json'):>8,} bytes, "
+          f"{row_objects:>6,} tracked objects, {row_ms:.2f} ms")
+    print(f"   columnar:      {size:>8,} bytes, {col_objects:>6,} tracked objects, {col_ms:.2f} ms")
+    sc = table.get('SC')
+    matches = sc.to_dict() == GlossaryIndex(terms).get('SC')
+    print(f"   🔍 SC → {sc['name_us']} (round-trip {'✅' if matches else '❌'})")
+
+
+if __name__ == "__main__":
+    main()
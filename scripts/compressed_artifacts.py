@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Precompressed gzip and brotli copies of the JSON artifacts
+Writes pretty and minified variants at maximum compression so a CDN or
+static server can send the bytes straight from disk, and prints a size report.
+Brotli is optional: install the brotli package to enable .br output.
+"""
+
+import gzip
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+from artifact_writer import json_bytes, write_bytes, write_counts
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+VARIANTS = ('pretty', 'minified')
+
+
+def gzip_bytes(data_bytes: bytes) -> bytes:
+    """Level-9 gzip with a fixed mtime so identical input gives identical output"""
+    return gzip.compress(data_bytes, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(data_bytes: bytes) -> bytes:
+    """Quality-11 brotli in text mode"""
+    return brotli.compress(data_bytes, quality=11, mode=brotli.MODE_TEXT)
+
+
+def variant_filename(filename: str, variant: str) -> str:
+    """glossary.json → glossary.json (pretty) or glossary.min.json (minified)"""
+    if variant == 'pretty':
+        return filename
+    return filename[:-len('.json')] + '.min.json' if filename.endswith('.json') else filename + '.min'
+
+
+def write_compressed_artifacts(files: Dict[str, object], variants: Iterable[str] = VARIANTS,
+                               pretty_bytes: Optional[Dict[str, bytes]] = None) -> List[Dict]:
+    """Write .gz/.br siblings (and .min.json files) for each artifact; returns report rows
+
+    pretty_bytes holds the exporter's own json_bytes() output per file, so the
+    pretty variant is compressed as written instead of being serialized again.
+    """
+    pretty_bytes = pretty_bytes or {}
+    if brotli is None:
+        print("⚠️  Skipping .br output (pip install brotli)")
+
+    report = []
+    for filename, data in files.items():
+        row = {'file': filename}
+        for variant in variants:
+            if variant == 'pretty' and filename in pretty_bytes:
+                data_bytes = pretty_bytes[filename]
+            else:
+                data_bytes = json_bytes(data, minified=variant != 'pretty')
+            name = variant_filename(filename, variant)
+
+            # The pretty file itself is written by the exporter; minified is new here
+            if variant != 'pretty':
+                write_bytes(name, data_bytes)
+
+            compressed = {'gz': gzip_bytes(data_bytes)}
+            if brotli is not None:
+                compressed['br'] = brotli_bytes(data_bytes)
+            for ext, payload in compressed.items():
+                write_bytes(f"{name}.{ext}", payload)
+            # A .br left over from an export that had brotli no longer matches the JSON
+            stale = f"{name}.br"
+            if 'br' not in compressed and os.path.exists(stale):
+                os.remove(stale)
+                write_counts['removed'] += 1
+                print(f"🗑️  Removed stale {stale}")
+
+            row[variant] = len(data_bytes)
+            for ext, payload in compressed.items():
+                row[f"{variant}_{ext}"] = len(payload)
+        report.append(row)
+
+    print_size_report(report)
+    return report
+
+
+def print_size_report(report: List[Dict]):
+    """Print raw, minified and compressed sizes per artifact"""
+    print("\n📦 COMPRESSION REPORT")
+    print(f"   {'Artifact':<20} {'Raw':>9} {'Minified':>9} {'Min .gz':>9} {'Min .br':>9} {'Best ratio':>10}")
+
+    totals = {}
+    for row in report:
+        for key, value in row.items():
+            if key != 'file':
+                totals[key] = totals.get(key, 0) + value
+        print(_report_line(row['file'], row))
+    if len(report) > 1:
+        print(_report_line('TOTAL', totals))
+
+
+def _report_line(label: str, row: Dict) -> str:
+    """One formatted report line"""
+    raw = row.get('pretty', 0)
+    sizes = [row.get(key) for key in ('minified', 'minified_gz', 'minified_br')]
+    compressed = [size for size in sizes[1:] if size]
+    ratio = f"{raw / min(compressed):.1f}x" if raw and compressed else '-'
+    cells = ''.join(f" {size:>9,}" if size is not None else f" {'-':>9}" for size in sizes)
+    return f"   {label:<20} {raw:>9,}{cells} {ratio:>10}"
+
+
+def main():
+    """Print the compression report for the committed artifacts without writing files"""
+    report = []
+    for filename in ('terms.json', 'glossary.json', 'categories.json', 'quiz.json', 'api-info.json'):
+        path = os.path.join('..', filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        row = {'file': filename}
+        for variant in VARIANTS:
+            data_bytes = json_bytes(data, minified=variant != 'pretty')
+            row[variant] = len(data_bytes)
+            row[f"{variant}_gz"] = len(gzip_bytes(data_bytes))
+            if brotli is not None:
+                row[f"{variant}_br"] = len(brotli_bytes(data_bytes))
+        report.append(row)
+    print_size_report(report)
+
+
+if __name__ == "__main__":
+    main()
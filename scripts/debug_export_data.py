@@ -5,6 +5,7 @@ Debug Export Data - Investigate what's actually being exported
 
 import json
 import os
+from glossary_index import GlossaryIndex
 
 def debug_export_data():
     """Debug what's actually in the exported files"""
@@ -62,9 +63,10 @@ def debug_export_data():
         
         # Check for terms with specific IDs
         print(f"\n🧪 SPECIFIC TERM CHECK:")
+        index = GlossaryIndex(terms)
         test_ids = ['SC', 'DC', 'HDC', 'CH', 'SLST', 'SN']
         for test_id in test_ids:
-            term = next((t for t in terms if t.get('id') == test_id), None)
+            term = index.get(test_id)
             if term:
                 fields_count = len(term.keys())
                 has_missing_fields = any(field in term for field in missing_check.keys())
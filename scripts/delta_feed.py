@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Versioned delta feed between consecutive exports
+Keeps the previous export's terms as a snapshot and writes
+deltas/{from}-{to}.json with added, removed and field-level changed terms,
+plus versions.json so offline clients can sync without a full download.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from artifact_writer import json_bytes, record_existing, write_bytes
+
+DELTA_DIR = 'deltas'
+SNAPSHOT_FILE = 'deltas/snapshot.json'
+VERSIONS_FILE = 'versions.json'
+
+
+def terms_by_id(terms: List[Dict]) -> Dict[str, Dict]:
+    """Index terms by ID, keeping the first occurrence like the rest of the export"""
+    indexed = {}
+    for term in terms:
+        if term.get('id'):
+            indexed.setdefault(term['id'], term)
+    return indexed
+
+
+def compute_delta(old_terms: Dict[str, Dict], new_terms: Dict[str, Dict]) -> Dict:
+    """Added, removed and changed terms between two {id: term} snapshots"""
+    added = [new_terms[term_id] for term_id in new_terms if term_id not in old_terms]
+    removed = [term_id for term_id in old_terms if term_id not in new_terms]
+
+    changed = {}
+    for term_id, new_term in new_terms.items():
+        old_term = old_terms.get(term_id)
+        if old_term is None or old_term == new_term:
+            continue
+        fields = {field: value for field, value in new_term.items() if old_term.get(field) != value}
+        change = {"fields": fields}
+        removed_fields = [field for field in old_term if field not in new_term]
+        if removed_fields:
+            change["removed_fields"] = removed_fields
+        changed[term_id] = change
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def apply_delta(terms: Dict[str, Dict], delta: Dict) -> Dict[str, Dict]:
+    """Apply a delta to an {id: term} mapping (what a syncing client does)"""
+    result = {term_id: dict(term) for term_id, term in terms.items()}
+    for term_id in delta["removed"]:
+        result.pop(term_id, None)
+    for term_id, change in delta["changed"].items():
+        term = result.setdefault(term_id, {})
+        term.update(change["fields"])
+        for field in change.get("removed_fields", []):
+            term.pop(field, None)
+    for term in delta["added"]:
+        result[term["id"]] = term
+    return result
+
+
+def _load(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write(path: str, data: Dict) -> int:
+    data_bytes = json_bytes(data)
+    write_bytes(path, data_bytes)
+    return len(data_bytes)
+
+
+def update_delta_feed(terms_data: List[Dict], delta_dir: str = DELTA_DIR,
+                      snapshot_file: str = SNAPSHOT_FILE, versions_file: str = VERSIONS_FILE,
+                      created: Optional[str] = None) -> Dict:
+    """Compare against the stored snapshot, write a delta if anything changed, update versions.json"""
+    os.makedirs(delta_dir, exist_ok=True)
+    new_terms = terms_by_id(terms_data)
+
+    snapshot = _load(snapshot_file)
+    versions = _load(versions_file) or {"current_version": 0, "versions": []}
+    now = created or datetime.now().isoformat()
+
+    if snapshot is None:
+        version = versions["current_version"] + 1
+        versions["versions"].append({
+            "version": version,
+            "created": now,
+            "total_terms": len(new_terms),
+            "delta": None
+        })
+        print(f"✅ Started delta feed at version {version} (no previous snapshot)")
+    else:
+        delta = compute_delta(snapshot["terms"], new_terms)
+        if not (delta["added"] or delta["removed"] or delta["changed"]):
+            print(f"✅ No term changes since version {snapshot['version']}, no delta written")
+            _record_feed_files(versions, versions_file, snapshot_file)
+            return versions
+
+        from_version = snapshot["version"]
+        version = from_version + 1
+        delta_file = f"{delta_dir}/{from_version}-{version}.json"
+        size = _write(delta_file, {
+            "from_version": from_version,
+            "to_version": version,
+            "created": now,
+            **delta
+        })
+        versions["versions"].append({
+            "version": version,
+            "created": now,
+            "total_terms": len(new_terms),
+            "delta": {
+                "from_version": from_version,
+                "file": delta_file,
+                "bytes": size,
+                "added": len(delta["added"]),
+                "removed": len(delta["removed"]),
+                "changed": len(delta["changed"])
+            }
+        })
+        print(f"✅ Created {delta_file} ({size} bytes): +{len(delta['added'])} "
+              f"-{len(delta['removed'])} ~{len(delta['changed'])} terms")
+
+    versions["current_version"] = version
+    versions["updated"] = now
+    _write(versions_file, versions)
+    _write(snapshot_file, {"version": version, "terms": new_terms})
+    _record_feed_files(versions, versions_file, snapshot_file)
+    return versions
+
+
+def _record_feed_files(versions: Dict, versions_file: str, snapshot_file: str):
+    """Register the feed files this run didn't write (older deltas, or all of them when nothing changed)"""
+    for filename in [versions_file, snapshot_file] + [
+            entry["delta"]["file"] for entry in versions["versions"] if entry["delta"]]:
+        record_existing(filename)
+
+
+def main():
+    """Show the current delta feed status"""
+    versions = _load(os.path.join('..', VERSIONS_FILE))
+    if not versions:
+        print("❌ No versions.json found. Run export_from_sheets.py first.")
+        return
+    print(f"📦 Current version: {versions['current_version']}")
+    for entry in versions['versions'][-10:]:
+        delta = entry['delta']
+        summary = (f"+{delta['added']} -{delta['removed']} ~{delta['changed']} ({delta['bytes']} bytes)"
+                   if delta else "full snapshot")
+        print(f"   v{entry['version']} {entry['created'][:19]}: {summary}")
+
+
+if __name__ == "__main__":
+    main()
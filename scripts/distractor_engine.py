@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Precomputed distractors for multiple-choice quiz questions
+Terms are bucketed by category and difficulty once; each term then gets a
+ranked list of plausible wrong answers (same category; textually similar terms
+from term_similarity first when given, then closest difficulty), so assembling
+a question is a small sample instead of a full scan.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+# Candidates kept per term; questions draw from the best DRAW_WINDOW of them
+MAX_CANDIDATES = 12
+DRAW_WINDOW = 6
+
+
+def difficulty_level(value) -> Optional[int]:
+    """'3' → 3; anything non-numeric → None"""
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+def _level_distance(level: Optional[int], other: Optional[int]):
+    """Sort key: same difficulty first, then the nearest levels, unrated terms last"""
+    if other == level:
+        return (0, 0, 0)
+    if other is None or level is None:
+        return (1, other is None, other or 0)
+    return (1, False, abs(other - level), other)
+
+
+class DistractorEngine:
+    """Ranked wrong answers for each term, built in one pass over the terms"""
+
+    def __init__(self, terms: List[Dict], answer_field: str = 'instruction',
+                 max_candidates: int = MAX_CANDIDATES, related: Optional[Dict[str, List[str]]] = None):
+        self.answer_field = answer_field
+        self.terms: Dict[str, Dict] = {}
+        for term in terms:
+            if term.get('id') and term.get(answer_field):
+                self.terms.setdefault(term['id'], term)
+
+        # category → difficulty level → term IDs, in glossary order
+        buckets: Dict[str, Dict[Optional[int], List[str]]] = {}
+        for term_id, term in self.terms.items():
+            level = difficulty_level(term.get('difficulty', ''))
+            buckets.setdefault(term.get('category', ''), {}).setdefault(level, []).append(term_id)
+
+        self.candidates: Dict[str, List[str]] = {}
+        for levels in buckets.values():
+            for level, term_ids in levels.items():
+                order = sorted(levels, key=lambda other: _level_distance(level, other))
+                for position, term_id in enumerate(term_ids):
+                    # Start each bucket at the term's relative position, so distractors
+                    # spread across the bucket instead of always being its first few terms
+                    starts = [(levels[other], position * len(levels[other]) // len(term_ids)) for other in order]
+                    if related and related.get(term_id):
+                        category = self.terms[term_id].get('category', '')
+                        similar = [other_id for other_id in related[term_id] if other_id in self.terms
+                                   and self.terms[other_id].get('category', '') == category]
+                        starts.insert(0, (similar, 0))
+                    self.candidates[term_id] = self._rank(term_id, starts, max_candidates)
+
+    def _rank(self, term_id: str, starts: List[Tuple[List[str], int]], limit: int) -> List[str]:
+        """First `limit` terms with a distinct, different answer, walking each bucket from its start"""
+        answer = self.terms[term_id][self.answer_field]
+        seen = {answer}
+        ranked = []
+        for bucket, offset in starts:
+            for i in range(len(bucket)):
+                other_id = bucket[(offset + i) % len(bucket)]
+                other_answer = self.terms[other_id][self.answer_field]
+                if other_answer in seen:
+                    continue
+                seen.add(other_answer)
+                ranked.append(other_id)
+                if len(ranked) == limit:
+                    return ranked
+        return ranked
+
+    def ranked(self, term_id: str) -> List[str]:
+        """Candidate distractor term IDs, most plausible first"""
+        return self.candidates.get(term_id, [])
+
+    def draw_pool(self, term_id: str, count: int = 3, window: int = DRAW_WINDOW) -> Optional[List[str]]:
+        """The wrong answers distractors() samples from, or None if there aren't enough"""
+        candidates = self.candidates.get(term_id, [])
+        if len(candidates) < count:
+            return None
+        return [self.terms[other_id][self.answer_field] for other_id in candidates[:max(window, count)]]
+
+    def distractors(self, term_id: str, count: int = 3, rng: Optional[random.Random] = None,
+                    window: int = DRAW_WINDOW) -> Optional[List[str]]:
+        """`count` wrong answers drawn from the top of the ranking, or None if there aren't enough"""
+        pool = self.draw_pool(term_id, count, window)
+        if pool is None:
+            return None
+        return (rng or random).sample(pool, count)
+
+    def multiple_choice(self, term_id: str, count: int = 3,
+                        rng: Optional[random.Random] = None) -> Optional[List[str]]:
+        """Shuffled choices (correct answer plus `count` distractors), or None"""
+        rng = rng or random
+        wrong = self.distractors(term_id, count, rng)
+        if wrong is None:
+            return None
+        choices = [self.terms[term_id][self.answer_field]] + wrong
+        rng.shuffle(choices)
+        return choices
+
+
+def main():
+    """Time engine construction and question assembly on a synthetic glossary"""
+    import time
+
+    terms = [{"id": f"T{i}", "category": f"Cat{i % 40}", "difficulty": str(1 + i % 4),
+              "instruction": f"Instruction {i}"} for i in range(20000)]
+
+    start = time.perf_counter()
+    engine = DistractorEngine(terms)
+    built = time.perf_counter() - start
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    questions = sum(engine.multiple_choice(term["id"], rng=rng) is not None for term in terms)
+    assembled = time.perf_counter() - start
+    print(f"   {len(terms):,} terms: engine built in {built * 1000:.0f} ms, "
+          f"{questions:,} questions in {assembled * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,25 @@ Export crochet glossary data from Google Sheets to JSON API files
 Auto-detects all columns and maps them to appropriate API field names
 """
 
+import argparse
 import json
 import os
-import subprocess
-from datetime import datetime
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+import re
+from datetime import datetime, timezone
+from autocomplete_index import build_autocomplete_index
+from fulltext_index import build_fulltext_index
+from binary_formats import write_binary_artifacts
+from compressed_artifacts import write_compressed_artifacts
+from columnar_glossary import write_columnar
+from sqlite_artifact import build_sqlite
+from binary_index import build_binary_index
+from delta_feed import update_delta_feed
+from generate_quizzes import build_quiz_data, quiz_questions, write_quiz_packages
+from term_similarity import build_similarity
+from row_mapper import RowMapper
+from row_source import ROW_SOURCE_ENV, SheetsSource, read_rows
+from artifact_writer import (canonical_hash, content_hash, file_hashes, json_bytes, print_write_summary,
+                             remove_stale_files, reset_write_counts, write_bytes, write_json, write_json_bytes)
 
 # Configuration
 SPREADSHEET_ID = '1WXt17J7Bn7nuRG3SV1HvvoWX4mvgZmY7dAeLRIlIh3A'
@@ -17,108 +30,195 @@ RANGE_NAME = 'Sheet1!A:Z'
 CREDENTIALS_FILE = 'credentials.json'
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 
-def get_sheets_data():
-    """Get data from Google Sheets"""
-    creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
-    service = build('sheets', 'v4', credentials=creds)
-    sheet = service.spreadsheets()
-    
-    result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=RANGE_NAME).execute()
-    values = result.get('values', [])
+# Also write one small file per category plus a manifest, so clients that need
+# a single category don't download the whole categories.json
+WRITE_CATEGORY_SHARDS = True
+CATEGORY_SHARD_DIR = 'categories'
+CATEGORY_SHARD_FIELDS = ['id', 'name_us', 'name_uk', 'difficulty', 'symbol']
+
+# Also write terms/{ID}.json for every term, listed in manifest.json (id → hash, size),
+# so pages can fetch just the terms they show and cache each one by hash.
+# manifest.json itself is always written and maps each endpoint to its content hash
+WRITE_TERM_FILES = True
+TERM_FILE_DIR = 'terms'
+MANIFEST_FILE = 'manifest.json'
+
+# MessagePack/CBOR siblings of glossary, terms, categories and quiz (needs msgpack/cbor2)
+WRITE_BINARY_FORMATS = True
+
+# Precompressed .gz/.br siblings (pretty and .min.json) plus a size report
+WRITE_COMPRESSED = True
+
+# Struct-of-arrays copy of glossary.json for fast bulk loading
+WRITE_COLUMNAR = True
+
+# glossary.sqlite with normalized tables, lookup indexes and FTS5 search
+WRITE_SQLITE = True
+
+# glossary.idx: mmap-able binary index for zero-copy lookups from worker processes
+WRITE_BINARY_INDEX = True
+
+# Keep the previous export as deltas/snapshot.json and write deltas/{from}-{to}.json
+# plus versions.json, so offline clients can sync only what changed
+WRITE_DELTAS = True
+
+# similar.json: top-k most similar terms per term from TF-IDF trigram vectors (needs numpy)
+WRITE_SIMILARITY = True
+
+def get_sheets_data(source=None):
+    """Get header + rows from a local snapshot if given (or $GLOSSARY_ROW_SOURCE), else Google Sheets"""
+    source = source or os.environ.get(ROW_SOURCE_ENV)
+    if not source:
+        source = SheetsSource(SPREADSHEET_ID, RANGE_NAME, CREDENTIALS_FILE, SCOPES)
+    headers, data_rows = read_rows(source)
     
-    if not values:
+    if not headers:
         print('No data found in spreadsheet')
-        return []
+        return [], []
     
-    headers = values[0]
-    data_rows = values[1:]
-    
-    print(f"Found {len(data_rows)} terms in Google Sheets")
     print(f"Columns: {headers}")
-    
     return headers, data_rows
 
-def create_api_files(headers, data_rows):
-    """Create all API JSON files"""
+def category_slug(name):
+    """File-safe lower-case slug for a category name"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or 'uncategorized'
+
+def write_category_shards(categories, shard_dir=CATEGORY_SHARD_DIR):
+    """Write categories/{slug}.json shards and a categories/index.json manifest"""
+    os.makedirs(shard_dir, exist_ok=True)
     
-    # Find column positions
-    col_indices = {header: i for i, header in enumerate(headers)}
+    manifest = {
+        "total_categories": len(categories),
+        "fields": CATEGORY_SHARD_FIELDS,
+        "categories": {}
+    }
+    used_slugs = set()
+    changed = 0
     
-    terms_data = []
-    categories = {}
-    quiz_questions = []
-    
-    for row in data_rows:
-        if len(row) < 2:  # Skip empty rows
-            continue
-            
-        # Get values safely
-        def get_cell(col_name, default=""):
-            idx = col_indices.get(col_name, -1)
-            return row[idx] if idx >= 0 and idx < len(row) else default
+    for cat, terms in categories.items():
+        # Sheet categories differ only by case sometimes ("Pattern" vs "pattern")
+        slug = category_slug(cat)
+        base_slug, n = slug, 2
+        while slug in used_slugs:
+            slug = f"{base_slug}-{n}"
+            n += 1
+        used_slugs.add(slug)
+        
+        shard = {
+            "category": cat,
+            "total_terms": len(terms),
+            "term_ids": [term["id"] for term in terms],
+            "terms": [
+                {field: term.get(field, "") for field in CATEGORY_SHARD_FIELDS}
+                for term in terms
+            ]
+        }
+        filename = f"{shard_dir}/{slug}.json"
+        data_bytes = json_bytes(shard)
+        changed += write_bytes(filename, data_bytes)
         
-        # Create term object
-        term = {}
-
-        # Essential fields with specific handling
-        term["id"] = get_cell("ID")
-        term["name_us"] = get_cell("Name_US") 
-        term["name_uk"] = get_cell("Name_UK", get_cell("Name_US"))
-
-        # Complete field mapping: Google Sheets → API field names
-        field_mapping = {
-            "Status": "status",
-            "Symbol": "symbol", 
-            "Category": "category",
-            "Tags": "tags",
-            "Description": "description",
-            "Priority": "priority",
-            "Difficulty": "difficulty",
-            "Instruction": "instruction",
-            "Time_To_Learn": "estimated_learning_time",
-            "Best_For": "best_use_cases", 
-            "Common_Mistakes": "common_mistakes",
-            "Pro_Tips": "pro_tips",
-            "Hook_Sizes": "hook_sizes",
-            "Left_Handed_Note": "left_handed_note",
-            "Abbrev_US": "abbreviation_us",
-            "Abbrev_UK": "abbreviation_uk"
+        manifest["categories"][cat] = {
+            "file": filename,
+            "total_terms": len(terms),
+            "bytes": len(data_bytes)
         }
+    
+    changed += write_bytes(f"{shard_dir}/index.json", json_bytes(manifest))
+    # Shards of renamed or removed categories would otherwise stay published
+    remove_stale_files(shard_dir, [c["file"] for c in manifest["categories"].values()] + [f"{shard_dir}/index.json"])
+    
+    total_bytes = sum(c["bytes"] for c in manifest["categories"].values())
+    print(f"✅ Created {shard_dir}/index.json + {len(categories)} category shards "
+          f"({total_bytes} bytes total, {changed} files changed)")
+    return manifest
 
-        # Auto-capture ALL other columns from Google Sheets
-        for header in headers:
-            if header not in ["ID", "Name_US", "Name_UK"]:
-                api_field = field_mapping.get(header, header.lower())
-                term[api_field] = get_cell(header)
-
-        # Special processing for tags array
-        if "tags" in term and term["tags"]:
-            term["tags"] = [tag.strip() for tag in term["tags"].split(",")]
-        elif "tags" in term:
-            term["tags"] = []
+def write_term_files(terms_data, term_dir=TERM_FILE_DIR):
+    """Write terms/{ID}.json per term; returns the manifest entries (id → file, hash, size)"""
+    os.makedirs(term_dir, exist_ok=True)
+    
+    entries = {}
+    used_names = set()
+    changed = 0
+    
+    for term in terms_data:
+        # IDs like "HOTH" and "hoth" would clobber each other on case-insensitive disks
+        name = re.sub(r'[^A-Za-z0-9_-]', '_', term["id"])
+        base_name, n = name, 2
+        while name.lower() in used_names:
+            name = f"{base_name}-{n}"
+            n += 1
+        used_names.add(name.lower())
+        
+        data_bytes = json_bytes(term)
+        filename = f"{term_dir}/{name}.json"
+        changed += write_bytes(filename, data_bytes)
         
-        # Clean up tags
-        term["tags"] = [tag.strip() for tag in term["tags"] if tag.strip()]
+        entries[term["id"]] = {
+            "file": filename,
+            "hash": content_hash(data_bytes),
+            "bytes": len(data_bytes)
+        }
+    
+    # Files of removed terms would otherwise stay published next to the manifest
+    remove_stale_files(term_dir, [t["file"] for t in entries.values()])
+    
+    total_bytes = sum(t["bytes"] for t in entries.values())
+    print(f"✅ Created {len(terms_data)} term files in {term_dir}/ ({total_bytes} bytes total, {changed} changed)")
+    return entries
+
+def export_timestamp():
+    """Current time, or SOURCE_DATE_EPOCH when set, so reproducible builds get fixed timestamps"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None).isoformat()
+    return datetime.now().isoformat()
+
+def previous_last_updated(filename, data_hash):
+    """last_updated of the file on disk if its content hash matches, else None"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if isinstance(previous, dict) and previous.get("content_hash") == data_hash:
+        return previous.get("last_updated")
+    return None
+
+def write_manifest(endpoints, terms=None, manifest_file=MANIFEST_FILE):
+    """Write manifest.json: endpoint → content hash, plus per-term files when written"""
+    manifest = {
+        "version": "1.0",
+        "hash_algorithm": "sha256 (first 16 hex chars)",
+        "endpoints": endpoints
+    }
+    if terms is not None:
+        manifest["total_terms"] = len(terms)
+        manifest["terms"] = terms
+    
+    write_json(manifest_file, manifest)
+    return manifest
+
+def create_api_files(headers, data_rows):
+    """Create all API JSON files"""
+    
+    reset_write_counts()
+    
+    # Resolve the header layout once; map_rows skips short rows and rows without an ID
+    mapper = RowMapper(headers)
+    
+    terms_data = []
+    categories = {}
+    
+    for term in mapper.map_rows(data_rows):
+        terms_data.append(term)
         
-        if term["id"]:  # Only include if has ID
-            terms_data.append(term)
-            
-            # Group by category
-            cat = term["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(term)
-            
-            # Create quiz question if has instruction
-            if term["instruction"]:
-                quiz_questions.append({
-                    "id": f"q_{term['id']}",
-                    "question": f"How do you make a {term['name_us']}?",
-                    "answer": term["instruction"],
-                    "term_id": term["id"],
-                    "category": term["category"],
-                    "difficulty": term["difficulty"]
-                })
+        # Group by category
+        cat = term["category"]
+        if cat not in categories:
+            categories[cat] = []
+        categories[cat].append(term)
+    
+    mapper.print_stats()
     
     # Create terms.json (lightweight)
     terms_simple = [
@@ -131,31 +231,43 @@ def create_api_files(headers, data_rows):
         for term in terms_data
     ]
     
+    # Advance the delta feed first, so glossary.json can say which feed version it
+    # holds: a client bootstrapping from it then syncs deltas from exactly there
+    feed_version = None
+    if WRITE_DELTAS:
+        feed_version = update_delta_feed(terms_data, created=export_timestamp())["current_version"]
+    
     # Create glossary.json (complete)
     glossary_complete = {
         "version": "1.0",
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": None,
+        "content_hash": None,
+        "feed_version": feed_version,
         "total_terms": len(terms_data),
         "terms": terms_data,
-        "search_index": list(set([
+        "search_index": sorted(set([
             term["name_us"].lower() for term in terms_data
         ] + [
             term["name_uk"].lower() for term in terms_data if term["name_uk"]
         ]))
     }
     
+    # Only bump last_updated when the data itself changed
+    glossary_hash = canonical_hash(glossary_complete)
+    glossary_complete["content_hash"] = glossary_hash
+    glossary_complete["last_updated"] = (previous_last_updated('glossary.json', glossary_hash)
+                                         or export_timestamp())
+    
     # Create categories.json
     categories_output = {
         "categories": {cat: len(terms) for cat, terms in categories.items()},
         "terms_by_category": categories
     }
     
-    # Create quiz.json
-    quiz_output = {
-        "total_questions": len(quiz_questions),
-        "categories": list(set([q["category"] for q in quiz_questions])),
-        "questions": quiz_questions
-    }
+    # Create quiz.json: the seeded quiz packs, built here rather than by a later
+    # generate_quizzes.py run, so its siblings and manifest hash describe what is published
+    quiz_output = build_quiz_data(glossary_complete)
+    write_quiz_packages(quiz_output, terms_data)
     
     # Create api-info.json
     api_info = {
@@ -166,7 +278,16 @@ def create_api_files(headers, data_rows):
             "terms.json": "Lightweight list of all terms",
             "glossary.json": "Complete glossary with full data",
             "categories.json": "Terms organized by category",
+            "categories/index.json": "Category manifest pointing at per-category shard files",
+            "manifest.json": "Content hash per endpoint, plus per-term files terms/{ID}.json with hash and size",
+            "glossary.columnar.json": "Complete glossary as one array per field (compact)",
+            "glossary.sqlite": "SQLite database with indexed terms, tags, categories, quiz and FTS5 search",
+            "glossary.idx": "Memory-mappable binary index for constant-time open and per-term decoding",
+            "versions.json": "Delta feed versions: deltas/{from}-{to}.json with added, removed and changed terms",
             "quiz.json": "Quiz questions and answers",
+            "autocomplete.json": "Sorted prefix index for search-as-you-type",
+            "fulltext.json": "BM25 inverted index over descriptions, instructions and tags",
+            "similar.json": "Most similar terms per term (related stitches), with cosine scores",
             "api-info.json": "This documentation"
         },
         "base_url": "https://raw.githubusercontent.com/this4dani/crochet-glossary-api/main/",
@@ -184,22 +305,63 @@ def create_api_files(headers, data_rows):
         'glossary.json': glossary_complete,
         'categories.json': categories_output,
         'quiz.json': quiz_output,
+        'autocomplete.json': build_autocomplete_index(terms_data),
+        'fulltext.json': build_fulltext_index(terms_data),
         'api-info.json': api_info
     }
     
-    for filename, data in files_to_write.items():
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✅ Created {filename} ({len(json.dumps(data))} bytes)")
+    similarity = build_similarity(terms_data) if WRITE_SIMILARITY else None
+    if similarity is not None:
+        files_to_write['similar.json'] = similarity
+    else:
+        # similar.json and its copies from an export that had numpy would stay published
+        del api_info["endpoints"]["similar.json"]
+        remove_stale_files('.', [], 'similar*.json*')
+    
+    # Incremental: each artifact is serialized once and only rewritten if its bytes changed
+    pretty_bytes = {filename: json_bytes(data) for filename, data in files_to_write.items()}
+    for filename, data_bytes in pretty_bytes.items():
+        write_json_bytes(filename, data_bytes)
+    
+    if WRITE_COLUMNAR:
+        write_columnar(terms_data)
+    
+    if WRITE_SQLITE:
+        build_sqlite(terms_data, quiz_questions(quiz_output))
+    
+    if WRITE_BINARY_INDEX:
+        build_binary_index(terms_data)
+    
+    if WRITE_BINARY_FORMATS:
+        write_binary_artifacts(files_to_write)
     
+    if WRITE_COMPRESSED:
+        write_compressed_artifacts(files_to_write, pretty_bytes=pretty_bytes)
+    
+    if WRITE_CATEGORY_SHARDS:
+        write_category_shards(categories)
+    
+    term_files = write_term_files(terms_data) if WRITE_TERM_FILES else None
+    # JSON endpoints hash their canonical data; every other published file (binary and
+    # compressed siblings, SQLite, index, shards, delta feed) the bytes it was written with
+    endpoints = {filename: file_hash for filename, file_hash in sorted(file_hashes.items())
+                 if not filename.startswith(f"{TERM_FILE_DIR}/")}
+    endpoints.update({filename: canonical_hash(data) for filename, data in files_to_write.items()})
+    write_manifest(dict(sorted(endpoints.items())), term_files)
+    
+    print_write_summary()
     return len(terms_data)
 
 def main():
     """Main export process"""
+    parser = argparse.ArgumentParser(description="Export the glossary sheet to the JSON API files")
+    parser.add_argument('--source', help="Local .csv/.xlsx/.json snapshot to export instead of the live sheet")
+    args = parser.parse_args()
+    
     print("Exporting DANI's Crochet Glossary from Google Sheets...")
     
-    # Get data from sheets
-    headers, data_rows = get_sheets_data()
+    # Get data from sheets (or a local snapshot)
+    headers, data_rows = get_sheets_data(args.source)
     
     if not data_rows:
         print("❌ No data found")
@@ -210,7 +372,7 @@ def main():
     
     print(f"\nExport complete!")
     print(f"📊 Total terms exported: {total_terms}")
-    print(f"📄 Files created: terms.json, glossary.json, categories.json, quiz.json, api-info.json")
+    print(f"📄 Files created: terms.json, glossary.json, categories.json, quiz.json, autocomplete.json, fulltext.json, api-info.json")
     print(f"\n📋 Next steps:")
     print(f"   git add *.json")
     print(f"   git commit -m 'Update from Google Sheets with instructions'")
@@ -218,24 +380,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-    
-    # Auto-update dependent scripts if data changed
-    try:
-        # Get glossary.json modification time
-        glossary_mtime = os.path.getmtime('glossary.json')
-        quiz_file = 'data/quizzes/beginner.json'
-        
-        # Check if quiz files need updating
-        if not os.path.exists(quiz_file) or os.path.getmtime(quiz_file) < glossary_mtime:
-            print("\n🔄 Data updated - auto-generating quizzes...")
-            result = subprocess.run(['python', 'generate_quizzes.py'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ Quizzes updated automatically")
-            else:
-                print(f"❌ Quiz generation failed: {result.stderr}")
-        else:
-            print("\n✅ Quizzes are up to date")
-            
-    except Exception as e:
-        print(f"\n⚠️ Auto-update check failed: {e}")
\ No newline at end of file
@@ -4,24 +4,31 @@ Export crochet glossary from Google Sheets to JSON API format
 Modified from export_to_glossarydata.py for API use
 """
 
+import argparse
+import os
 import sys
 import json
 from datetime import datetime
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from binary_formats import write_binary_artifacts
+from compressed_artifacts import write_compressed_artifacts
+from row_source import ROW_SOURCE_ENV, read_rows, rows_to_records
+from sheets_service import build_sheets_service
 
 # Configuration
 SPREADSHEET_ID = '1WXt17J7Bn7nuRG3SV1HvvoWX4mvgZmY7dAeLRIlIh3A'
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 SERVICE_ACCOUNT_FILE = 'credentials.json'
 
+# MessagePack/CBOR siblings of glossary, terms, categories and quiz (needs msgpack/cbor2)
+WRITE_BINARY_FORMATS = True
+
+# Precompressed .gz/.br siblings (pretty and .min.json) plus a size report
+WRITE_COMPRESSED = True
+
 def get_sheets_service():
     """Initialize Google Sheets API service"""
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        service = build('sheets', 'v4', credentials=creds)
-        return service.spreadsheets()
+        return build_sheets_service(SERVICE_ACCOUNT_FILE, SCOPES).spreadsheets()
     except Exception as e:
         print(f"Error connecting to Google Sheets: {e}")
         sys.exit(1)
@@ -39,22 +46,7 @@ def read_sheet_data(sheets):
             print("No data found in spreadsheet!")
             return []
         
-        headers = values[0]
-        terms = []
-        
-        for row_idx, row in enumerate(values[1:], start=2):
-            if not row:  # Skip empty rows
-                continue
-                
-            term = {}
-            for col_idx, header in enumerate(headers):
-                if col_idx < len(row) and row[col_idx].strip():
-                    term[header] = row[col_idx].strip()
-            
-            # Only include if has ID
-            if term.get('ID'):
-                terms.append(term)
-        
+        terms = rows_to_records(values[0], values[1:])
         print(f"✅ Read {len(terms)} terms from Google Sheets")
         return terms
         
@@ -62,6 +54,15 @@ def read_sheet_data(sheets):
         print(f"Error reading sheet data: {e}")
         return []
 
+def read_snapshot_data(path):
+    """Read header-keyed terms from a local .csv/.xlsx/.json snapshot of the sheet"""
+    try:
+        headers, data_rows = read_rows(path)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error reading snapshot: {e}")
+        return []
+    return rows_to_records(headers, data_rows)
+
 def clean_and_validate_terms(terms):
     """Clean and validate term data"""
     cleaned_terms = []
@@ -273,17 +274,36 @@ def save_json_files(api_data, quiz_data):
     with open('api-info.json', 'w', encoding='utf-8') as f:
         json.dump(api_info, f, indent=2, ensure_ascii=False)
     print("✅ Created api-info.json")
+    
+    written_files = {
+        'glossary.json': api_data,
+        'terms.json': terms_only,
+        'categories.json': categories_data,
+        'quiz.json': quiz_structure,
+        'api-info.json': api_info
+    }
+    
+    if WRITE_BINARY_FORMATS:
+        write_binary_artifacts(written_files)
+    
+    if WRITE_COMPRESSED:
+        write_compressed_artifacts(written_files)
 
 def main():
     """Main export function"""
     print("🧶 DANI'S Crochet Glossary → JSON API Export")
     print("=" * 50)
     
-    # Connect to Google Sheets
-    sheets = get_sheets_service()
+    parser = argparse.ArgumentParser(description="Export the glossary sheet to the meta/data JSON API")
+    parser.add_argument('--source', help="Local .csv/.xlsx/.json snapshot to export instead of the live sheet")
+    args = parser.parse_args()
     
-    # Read data
-    raw_terms = read_sheet_data(sheets)
+    # Read data from a local snapshot, or connect to Google Sheets
+    snapshot = args.source or os.environ.get(ROW_SOURCE_ENV)
+    if snapshot:
+        raw_terms = read_snapshot_data(snapshot)
+    else:
+        raw_terms = read_sheet_data(get_sheets_service())
     if not raw_terms:
         print("❌ No data to export!")
         return
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Bitset-backed facet index for tag, category, difficulty and status filters
+Each term gets a dense integer id; each facet value keeps one bitmap (a Python
+int), so filter expressions and per-facet counts are plain bitwise operations
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+from glossary_index import load_glossary_terms
+
+FACETS = ('tag', 'category', 'difficulty', 'status')
+
+# Operators usable on numeric facets (difficulty)
+COMPARISONS = {
+    '<=': lambda a, b: a <= b,
+    '>=': lambda a, b: a >= b,
+    '<': lambda a, b: a < b,
+    '>': lambda a, b: a > b,
+    '=': lambda a, b: a == b,
+    ':': lambda a, b: a == b,
+}
+
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<lparen>\() |
+        (?P<rparen>\)) |
+        (?P<op>AND\b|OR\b|NOT\b) |
+        (?P<clause>(?P<facet>[a-z_]+)\s*(?P<cmp><=|>=|<|>|=|:)\s*(?P<value>"[^"]*"|[^\s()]+))
+    )""", re.VERBOSE | re.IGNORECASE)
+
+
+class FacetQueryError(ValueError):
+    """Raised for malformed facet filter expressions"""
+
+
+def _normalize(value) -> str:
+    return str(value).strip().lower()
+
+
+class FacetIndex:
+    """One bitmap per facet value over densely numbered terms"""
+
+    def __init__(self, terms: List[Dict]):
+        self.terms = [t for t in terms if t.get('id')]
+        self.all_bits = (1 << len(self.terms)) - 1
+        self.bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+
+        for position, term in enumerate(self.terms):
+            bit = 1 << position
+            for tag in term.get('tags', []):
+                self._set(self.bitmaps['tag'], tag, bit)
+            self._set(self.bitmaps['category'], term.get('category', ''), bit)
+            self._set(self.bitmaps['difficulty'], term.get('difficulty', ''), bit)
+            self._set(self.bitmaps['status'], term.get('status', ''), bit)
+
+    @staticmethod
+    def _set(bitmaps: Dict[str, int], value, bit: int):
+        key = _normalize(value)
+        if key:
+            bitmaps[key] = bitmaps.get(key, 0) | bit
+
+    @classmethod
+    def from_file(cls, path: str = 'glossary.json') -> 'FacetIndex':
+        """Build from an exported glossary.json"""
+        return cls(load_glossary_terms(path))
+
+    # ---- Query evaluation --------------------------------------------------
+
+    def clause_bits(self, facet: str, cmp: str, value: str) -> int:
+        """Bitmap for a single facet:value clause"""
+        facet = facet.lower()
+        if facet not in self.bitmaps:
+            raise FacetQueryError(f"Unknown facet '{facet}' (expected one of {', '.join(FACETS)})")
+
+        value = _normalize(value.strip('"'))
+        bitmaps = self.bitmaps[facet]
+        if cmp in (':', '='):
+            return bitmaps.get(value, 0)
+
+        try:
+            target = float(value)
+        except ValueError:
+            raise FacetQueryError(f"'{cmp}' needs a number, got '{value}'") from None
+
+        bits = 0
+        for key, bitmap in bitmaps.items():
+            try:
+                if COMPARISONS[cmp](float(key), target):
+                    bits |= bitmap
+            except ValueError:
+                continue
+        return bits
+
+    def tokenize(self, expression: str) -> List[Tuple]:
+        """Split a filter expression into parens, operators and clauses"""
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = TOKEN_PATTERN.match(expression, position)
+            if not match:
+                raise FacetQueryError(f"Cannot parse filter near '{expression[position:]}'")
+            if match.group('lparen'):
+                tokens.append(('(',))
+            elif match.group('rparen'):
+                tokens.append((')',))
+            elif match.group('op'):
+                tokens.append((match.group('op').upper(),))
+            else:
+                tokens.append(('CLAUSE', match.group('facet'), match.group('cmp'), match.group('value')))
+            position = match.end()
+        return tokens
+
+    def evaluate(self, expression: str) -> int:
+        """Evaluate a filter like 'tag:amigurumi AND difficulty<=2 AND NOT category:slang'
+
+        Precedence is NOT > AND > OR; adjacent clauses without an operator are ANDed.
+        """
+        if not expression.strip():
+            return self.all_bits
+
+        tokens = self.tokenize(expression)
+        position = 0
+
+        def peek():
+            return tokens[position][0] if position < len(tokens) else None
+
+        def parse_or():
+            nonlocal position
+            bits = parse_and()
+            while peek() == 'OR':
+                position += 1
+                bits |= parse_and()
+            return bits
+
+        def parse_and():
+            nonlocal position
+            bits = parse_not()
+            while peek() in ('AND', 'NOT', 'CLAUSE', '('):
+                if peek() == 'AND':
+                    position += 1
+                bits &= parse_not()
+            return bits
+
+        def parse_not():
+            nonlocal position
+            if peek() == 'NOT':
+                position += 1
+                return self.all_bits & ~parse_not()
+            return parse_atom()
+
+        def parse_atom():
+            nonlocal position
+            token = tokens[position] if position < len(tokens) else None
+            if token is None:
+                raise FacetQueryError("Filter ends unexpectedly")
+            position += 1
+            if token[0] == '(':
+                bits = parse_or()
+                if peek() != ')':
+                    raise FacetQueryError("Missing closing parenthesis")
+                position += 1
+                return bits
+            if token[0] == 'CLAUSE':
+                return self.clause_bits(*token[1:])
+            raise FacetQueryError(f"Unexpected '{token[0]}'")
+
+        bits = parse_or()
+        if position != len(tokens):
+            raise FacetQueryError(f"Unexpected '{tokens[position][0]}'")
+        return bits
+
+    # ---- Results -----------------------------------------------------------
+
+    def counts(self, bits: int, facets=FACETS) -> Dict[str, Dict[str, int]]:
+        """Per-value counts of matching terms for each facet"""
+        result = {}
+        for facet in facets:
+            facet_counts = {}
+            for value, bitmap in self.bitmaps[facet].items():
+                count = (bitmap & bits).bit_count()
+                if count:
+                    facet_counts[value] = count
+            result[facet] = dict(sorted(facet_counts.items(), key=lambda item: (-item[1], item[0])))
+        return result
+
+    def positions(self, bits: int) -> List[int]:
+        """Dense ids of the set bits, ascending"""
+        positions = []
+        while bits:
+            low = bits & -bits
+            positions.append(low.bit_length() - 1)
+            bits ^= low
+        return positions
+
+    def query(self, expression: str, limit: int = None) -> Dict:
+        """Filter terms and return matches plus facet counts in one pass"""
+        bits = self.evaluate(expression)
+        positions = self.positions(bits)
+        if limit is not None:
+            positions = positions[:limit]
+        return {
+            "total": bits.bit_count(),
+            "terms": [self.terms[p] for p in positions],
+            "facets": self.counts(bits),
+        }
+
+
+def main():
+    """Run a sample facet query against glossary.json"""
+    index = FacetIndex.from_file('../glossary.json')
+    print(f"✅ Indexed {len(index.terms)} terms")
+    for facet in FACETS:
+        print(f"   {facet}: {len(index.bitmaps[facet])} values")
+
+    expression = 'tag:amigurumi AND difficulty<=2 AND NOT category:slang'
+    result = index.query(expression)
+    print(f"\n🔍 {expression} → {result['total']} terms")
+    print(f"   {', '.join(t['id'] for t in result['terms'])}")
+    print(f"   categories: {result['facets']['category']}")
+
+
+if __name__ == "__main__":
+    main()
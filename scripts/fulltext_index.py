@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text index over term names, descriptions, instructions and tags
+Built at export time into fulltext.json; posting lists are stored as flat
+delta-encoded [doc gap, term frequency, ...] integer arrays
+"""
+
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+DEFAULT_LIMIT = 10
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in',
+    'into', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'then', 'this',
+    'to', 'which', 'with', 'what', 'you', 'your', 'make', 'makes', 'used',
+}
+
+# Crochet words the generic suffix rules would mangle or miss
+CROCHET_STEMS = {
+    'crocheted': 'crochet', 'crocheting': 'crochet', 'crochets': 'crochet',
+    'stitches': 'stitch', 'stitched': 'stitch', 'stitching': 'stitch',
+    'trebles': 'treble', 'doubles': 'double', 'singles': 'single',
+    'hooks': 'hook', 'hooked': 'hook', 'hooking': 'hook',
+    'yarns': 'yarn', 'yarnover': 'yo', 'yarnovers': 'yo',
+    'increases': 'increase', 'increased': 'increase', 'increasing': 'increase',
+    'decreases': 'decrease', 'decreased': 'decrease', 'decreasing': 'decrease',
+    'blocking': 'block', 'blocked': 'block', 'frogging': 'frog', 'frogged': 'frog',
+    'amigurumis': 'amigurumi',
+}
+
+
+def stem(word: str) -> str:
+    """Light suffix stemmer tuned for crochet vocabulary"""
+    if word in CROCHET_STEMS:
+        word = CROCHET_STEMS[word]
+    elif len(word) <= 3:
+        return word
+    elif word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    elif word.endswith(('ches', 'shes', 'sses', 'xes')):
+        return word[:-2]
+    elif word.endswith('ing') and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith('ed') and len(word) > 4:
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    # Fold silent e so "texture" and "textur(ed)" meet
+    if word.endswith('e') and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def analyze(text: str) -> List[str]:
+    """Tokenize, drop stopwords and stem"""
+    if not text:
+        return []
+    return [stem(w) for w in WORD_PATTERN.findall(text.lower()) if w not in STOPWORDS]
+
+
+def term_text(term: Dict) -> str:
+    """Searchable text for a term"""
+    return ' '.join([
+        term.get('name_us', ''),
+        term.get('name_uk', ''),
+        term.get('description', ''),
+        term.get('instruction', ''),
+        ' '.join(term.get('tags', [])),
+    ])
+
+
+def build_fulltext_index(terms: List[Dict]) -> Dict:
+    """Build the inverted index written to fulltext.json"""
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    doc_lengths = []
+
+    for doc_id, term in enumerate(terms):
+        tokens = analyze(term_text(term))
+        doc_lengths.append(len(tokens))
+        for token, frequency in Counter(tokens).items():
+            postings.setdefault(token, []).append((doc_id, frequency))
+
+    encoded = {}
+    for token in sorted(postings):
+        flat = []
+        last = 0
+        for doc_id, frequency in postings[token]:
+            flat.extend((doc_id - last, frequency))
+            last = doc_id
+        encoded[token] = flat
+
+    return {
+        "version": "1.0",
+        "ids": [term['id'] for term in terms],
+        "doc_lengths": doc_lengths,
+        "average_length": round(sum(doc_lengths) / len(doc_lengths), 4) if doc_lengths else 0,
+        "postings": encoded,
+    }
+
+
+def decode_postings(flat: List[int]) -> List[Tuple[int, int]]:
+    """Expand a delta-encoded posting list into (doc id, frequency) pairs"""
+    pairs = []
+    doc_id = 0
+    for i in range(0, len(flat), 2):
+        doc_id += flat[i]
+        pairs.append((doc_id, flat[i + 1]))
+    return pairs
+
+
+class FullTextIndex:
+    """BM25 query API over a built full-text index"""
+
+    def __init__(self, data: Dict):
+        self.ids = data['ids']
+        self.doc_lengths = data['doc_lengths']
+        self.average_length = data['average_length'] or 1
+        self.postings = data['postings']
+        self._decoded: Dict[str, List[Tuple[int, int]]] = {}
+
+    @classmethod
+    def from_terms(cls, terms: List[Dict]) -> 'FullTextIndex':
+        """Build directly from term dicts"""
+        return cls(build_fulltext_index(terms))
+
+    @classmethod
+    def from_file(cls, path: str = 'fulltext.json') -> 'FullTextIndex':
+        """Load the exported fulltext.json"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _postings(self, token: str) -> List[Tuple[int, int]]:
+        """Decoded posting list for a token, cached after first use"""
+        pairs = self._decoded.get(token)
+        if pairs is None:
+            pairs = decode_postings(self.postings.get(token, []))
+            self._decoded[token] = pairs
+        return pairs
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Tuple[str, float]]:
+        """Return (term id, BM25 score) pairs, best first"""
+        total_docs = len(self.ids)
+        scores: Dict[int, float] = {}
+
+        for token in set(analyze(query)):
+            pairs = self._postings(token)
+            if not pairs:
+                continue
+            idf = math.log(1 + (total_docs - len(pairs) + 0.5) / (len(pairs) + 0.5))
+            for doc_id, frequency in pairs:
+                norm = K1 * (1 - B + B * self.doc_lengths[doc_id] / self.average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (K1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.ids[doc_id], round(score, 4)) for doc_id, score in best]
+
+
+def main():
+    """Run sample questions against glossary.json"""
+    from glossary_index import GlossaryIndex
+
+    glossary = GlossaryIndex.from_file('../glossary.json')
+    index = FullTextIndex.from_terms(glossary.terms)
+    print(f"✅ Indexed {len(index.ids)} terms, {len(index.postings)} distinct tokens")
+    for query in ['which stitches make a textured fabric', 'joining granny squares', 'tight fabric for toys']:
+        print(f"\n   🔍 {query!r}")
+        for term_id, score in index.search(query, 3):
+            print(f"      {score:6.2f}  {term_id}: {glossary.get(term_id)['name_us']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Typo-tolerant term search
+Candidate words come from a character trigram index, then each candidate is
+verified with a bounded edit distance so "tunisan" or "hald double"
+still find Tunisian and Half Double Crochet
+"""
+
+import heapq
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from glossary_index import load_glossary_terms
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Sheet priority → popularity weight used to break ties between equal distances
+PRIORITY_WEIGHTS = {'high': 3, 'medium': 2, 'low': 1}
+
+DEFAULT_LIMIT = 10
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case alphanumeric words"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def trigrams(word: str) -> List[str]:
+    """Padded character trigrams of a word ("sc" → "$sc", "sc$")"""
+    padded = f"${word}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def max_typos(word: str) -> int:
+    """Edit budget for a query word: exact for short words, more for long ones"""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Damerau (optimal string alignment) distance, or None once it must exceed limit
+
+    Adjacent transpositions count as one edit, so "singel" is one typo from "single".
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    if a == b:
+        return 0
+
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = current[j - 1] + 1
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if previous[j - 1] + (ca != cb) < cost:
+                cost = previous[j - 1] + (ca != cb)
+            if (before_previous is not None and j > 1
+                    and ca == b[j - 2] and a[i - 2] == cb
+                    and before_previous[j - 2] + 1 < cost):
+                cost = before_previous[j - 2] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return None
+        before_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= limit else None
+
+
+def term_popularity(term: Dict) -> int:
+    """Popularity score from the sheet's Priority and Status columns"""
+    score = PRIORITY_WEIGHTS.get(str(term.get('priority', '')).strip().lower(), 0)
+    if str(term.get('status', '')).lower() == 'existing':
+        score += 1  # long-standing core vocabulary
+    return score
+
+
+class FuzzySearch:
+    """Trigram candidate index with bounded edit-distance verification"""
+
+    def __init__(self, terms: List[Dict], popularity: Optional[Dict[str, int]] = None):
+        self.terms = [t for t in terms if t.get('id')]
+        self.popularity = [
+            (popularity or {}).get(t['id'], term_popularity(t)) for t in self.terms
+        ]
+
+        self.words: List[str] = []
+        self.word_ids: Dict[str, int] = {}
+        self.word_terms: List[set] = []
+        self.gram_postings: Dict[str, List[int]] = {}
+
+        for position, term in enumerate(self.terms):
+            text = ' '.join([
+                term.get('id', ''),
+                term.get('name_us', ''),
+                term.get('name_uk', ''),
+                term.get('abbreviation_us', ''),
+                term.get('abbreviation_uk', ''),
+            ])
+            for word in tokenize(text):
+                self.word_terms[self._word_id(word)].add(position)
+
+    def _word_id(self, word: str) -> int:
+        """Intern a vocabulary word and index its trigrams"""
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            word_id = len(self.words)
+            self.word_ids[word] = word_id
+            self.words.append(word)
+            self.word_terms.append(set())
+            for gram in set(trigrams(word)):
+                self.gram_postings.setdefault(gram, []).append(word_id)
+        return word_id
+
+    @classmethod
+    def from_file(cls, path: str = 'glossary.json') -> 'FuzzySearch':
+        """Build from an exported glossary.json"""
+        return cls(load_glossary_terms(path))
+
+    def match_word(self, query_word: str) -> Dict[int, int]:
+        """Map term positions to the best edit distance for one query word"""
+        limit = max_typos(query_word)
+        matches: Dict[int, int] = {}
+
+        exact = self.word_ids.get(query_word)
+        if exact is not None:
+            for position in self.word_terms[exact]:
+                matches[position] = 0
+            if limit == 0:
+                return matches
+
+        # q-gram lemma: a substitution, insertion or deletion destroys at most 3
+        # trigrams, an adjacent transposition ("chian") up to 4
+        grams = set(trigrams(query_word))
+        required = max(1, len(grams) - 4 * limit)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self.gram_postings.get(gram, ()))
+
+        for word_id, shared in counts.items():
+            if shared < required or word_id == exact:
+                continue
+            distance = bounded_edit_distance(query_word, self.words[word_id], limit)
+            if distance is None:
+                continue
+            for position in self.word_terms[word_id]:
+                if distance < matches.get(position, limit + 1):
+                    matches[position] = distance
+
+        return matches
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Tuple[Dict, int]]:
+        """Return (term, total edit distance) pairs ranked by distance then popularity"""
+        words = tokenize(query)
+        if not words:
+            return []
+
+        # Every query word must match some word of the term; intersect smallest first
+        word_matches = sorted((self.match_word(word) for word in dict.fromkeys(words)), key=len)
+        totals = word_matches[0]
+        for matches in word_matches[1:]:
+            totals = {
+                position: distance + matches[position]
+                for position, distance in totals.items()
+                if position in matches
+            }
+            if not totals:
+                return []
+
+        ranked = heapq.nsmallest(
+            limit,
+            totals.items(),
+            key=lambda item: (
+                item[1],
+                -self.popularity[item[0]],
+                len(self.terms[item[0]].get('name_us', '')),
+                self.terms[item[0]]['id'],
+            ),
+        )
+        return [(self.terms[position], distance) for position, distance in ranked]
+
+
+def main():
+    """Run a few typo queries against glossary.json"""
+    engine = FuzzySearch.from_file('../glossary.json')
+    print(f"✅ Indexed {len(engine.words)} words from {len(engine.terms)} terms")
+    for query in ['tunisan', 'hald double', 'singel crochet', 'chian', 'crohcet', 'bobble']:
+        results = ', '.join(f"{t['id']}({d})" for t, d in engine.search(query, 5))
+        print(f"   🔍 {query!r} → {results or 'no matches'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,174 +4,283 @@ Generate quiz questions from crochet glossary data
 Creates multiple quiz formats for different skill levels
 """
 
+import argparse
 import json
+import os
 import random
-from typing import List, Dict
+from datetime import date
+from typing import List, Dict, Optional
+from artifact_writer import canonical_hash, content_hash, write_json
+from distractor_engine import MAX_CANDIDATES, DistractorEngine
+from term_similarity import nearest_neighbours
 
-def check_if_update_needed():
-    """Check if quiz files need updating based on glossary.json timestamp"""
-    try:
-        import os
-        glossary_time = os.path.getmtime('../glossary.json')
-        quiz_file = '../data/quizzes/intermediate_pack.json'
-        
-        if os.path.exists(quiz_file):
-            quiz_time = os.path.getmtime(quiz_file)
-            if quiz_time >= glossary_time:
-                print("📋 Quiz files are up-to-date, skipping generation")
-                return False
-        
-        print("🔄 Glossary data is newer, regenerating quizzes...")
-        return True
-        
-    except Exception as e:
-        print(f"Timestamp check failed: {e}")
-        return True
+# Deterministic mode: every shuffle/sample is seeded, so the same glossary plus
+# the same seed produces byte-identical quiz files. None (--random) reshuffles each run.
+RANDOM_SEED = 42
 
-if __name__ == "__main__":
-    if not check_if_update_needed():
-        exit(0)
+def seeded_rng(seed, *key):
+    """Random instance for one decision, keyed so editing one term doesn't reshuffle the rest"""
+    if seed is None:
+        return random.Random()
+    return random.Random(':'.join(str(k) for k in (seed,) + key))
 
-def load_glossary_data():
-    """Load the complete glossary data"""
+# Per-term question cache: content hash of a term → the questions built from it, so
+# an export only rebuilds questions for added or changed terms. It is build state,
+# kept outside the published quizzes/ directory (and gitignored).
+# Bump QUESTION_CACHE_VERSION whenever the question builders change.
+QUESTION_CACHE_FILE = '.cache/question_cache.json'
+QUESTION_CACHE_VERSION = 2
+
+# Order of question types in the assembled list (the packs take the first N per difficulty)
+QUESTION_GROUPS = (("instruction", "multiple_choice"), ("terminology", "abbreviation"),
+                   ("symbol",), ("definition",))
+
+def load_glossary():
+    """Load glossary.json as a dict ({} if missing)"""
     try:
         with open('glossary.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get('terms', [])
+            return json.load(f)
     except FileNotFoundError:
         print("❌ glossary.json not found. Run export_from_sheets.py first.")
-        return []
+        return {}
 
-def create_instruction_quizzes(terms: List[Dict]) -> List[Dict]:
-    """Create quizzes based on instructions"""
-    quizzes = []
-    
-    # Only terms with instructions
+def load_glossary_data():
+    """Load the complete glossary data"""
+    return load_glossary().get('terms', [])
+
+def glossary_content_hash(glossary: Dict) -> str:
+    """The exporter's content_hash, or the same canonical hash computed here"""
+    return glossary.get('content_hash') or canonical_hash(glossary)
+
+def build_distractor_engine(terms: List[Dict]) -> DistractorEngine:
+    """Distractor engine over the terms with instructions"""
     terms_with_instructions = [t for t in terms if t.get('instruction')]
-    
+    by_category = {}
     for term in terms_with_instructions:
-        # Basic instruction quiz
-        quizzes.append({
-            "id": f"inst_{term['id']}",
-            "type": "instruction",
-            "category": term.get('category', 'Basic'),
-            "difficulty": term.get('difficulty', 'Beginner'),
-            "question": f"How do you make a {term['name_us']}?",
-            "answer": term['instruction'],
-            "term_id": term['id'],
-            "points": 10
-        })
-        
-        # Multiple choice if we have enough similar terms
-        similar_terms = [t for t in terms_with_instructions 
-                        if t.get('category') == term.get('category') and t['id'] != term['id']]
-        
-        if len(similar_terms) >= 3:
-            wrong_answers = random.sample([t['instruction'] for t in similar_terms[:3]], 3)
-            choices = [term['instruction']] + wrong_answers
-            random.shuffle(choices)
-            
-            quizzes.append({
-                "id": f"mc_{term['id']}",
-                "type": "multiple_choice",
-                "category": term.get('category', 'Basic'),
-                "difficulty": term.get('difficulty', 'Beginner'),
-                "question": f"What is the correct instruction for {term['name_us']}?",
-                "choices": choices,
-                "correct_answer": term['instruction'],
-                "term_id": term['id'],
-                "points": 15
-            })
+        by_category.setdefault(term.get('category', ''), []).append(term)
     
-    return quizzes
+    # Textually similar instructions make the most plausible distractors (needs numpy).
+    # Distractors never leave the term's category, so neighbours are computed per
+    # category: a term's choices then depend on its own category only
+    related = {}
+    for category_terms in by_category.values():
+        related.update({term_id: [other_id for other_id, _ in neighbours]
+                        for term_id, neighbours in nearest_neighbours(category_terms, MAX_CANDIDATES).items()})
+    return DistractorEngine(terms_with_instructions, related=related)
 
-def create_terminology_quizzes(terms: List[Dict]) -> List[Dict]:
-    """Create quizzes about terminology (US vs UK, abbreviations)"""
+# Per-term question builders: each returns one question for the term, or None
+# if the term lacks the data for that question type
+
+def instruction_question(term: Dict) -> Optional[Dict]:
+    if not term.get('instruction'):
+        return None
+    return {
+        "id": f"inst_{term['id']}",
+        "type": "instruction",
+        "category": term.get('category', 'Basic'),
+        "difficulty": term.get('difficulty', 'Beginner'),
+        "question": f"How do you make a {term['name_us']}?",
+        "answer": term['instruction'],
+        "term_id": term['id'],
+        "points": 10
+    }
+
+def multiple_choice_question(term: Dict, distractors: DistractorEngine, rng: random.Random) -> Optional[Dict]:
+    if not term.get('instruction'):
+        return None
+    # Multiple choice if we have enough similar terms (same category, closest difficulty)
+    choices = distractors.multiple_choice(term['id'], 3, rng)
+    if not choices:
+        return None
+    return {
+        "id": f"mc_{term['id']}",
+        "type": "multiple_choice",
+        "category": term.get('category', 'Basic'),
+        "difficulty": term.get('difficulty', 'Beginner'),
+        "question": f"What is the correct instruction for {term['name_us']}?",
+        "choices": choices,
+        "correct_answer": term['instruction'],
+        "term_id": term['id'],
+        "points": 15
+    }
+
+def uk_term_question(term: Dict) -> Optional[Dict]:
+    # US vs UK terminology
+    if not term.get('id') or not term.get('name_uk') or term['name_uk'] == term['name_us']:
+        return None
+    return {
+        "id": f"uk_{term['id']}",
+        "type": "terminology",
+        "category": "US_vs_UK",
+        "difficulty": "Intermediate",
+        "question": f"What is the UK term for '{term['name_us']}'?",
+        "answer": term['name_uk'],
+        "term_id": term['id'],
+        "points": 5
+    }
+
+def abbreviation_question(term: Dict) -> Optional[Dict]:
+    if not term.get('id') or not term.get('abbreviation_us'):
+        return None
+    return {
+        "id": f"abbrev_{term['id']}",
+        "type": "abbreviation",
+        "category": term.get('category', 'Basic'),
+        "difficulty": "Beginner",
+        "question": f"What does '{term['abbreviation_us']}' stand for?",
+        "answer": term['name_us'],
+        "term_id": term['id'],
+        "points": 5
+    }
+
+def symbol_question(term: Dict) -> Optional[Dict]:
+    if not term.get('symbol'):
+        return None
+    return {
+        "id": f"symbol_{term['id']}",
+        "type": "symbol",
+        "category": "Symbols",
+        "difficulty": "Advanced",
+        "question": f"What stitch does this symbol represent: {term['symbol']}?",
+        "answer": term['name_us'],
+        "term_id": term['id'],
+        "points": 10
+    }
+
+def definition_question(term: Dict) -> Optional[Dict]:
+    # Definition matching
+    if not term.get('description'):
+        return None
+    return {
+        "id": f"def_{term['id']}",
+        "type": "definition",
+        "category": term.get('category', 'Basic'),
+        "difficulty": term.get('difficulty', 'Beginner'),
+        "question": f"Which stitch matches this description: {term['description']}?",
+        "answer": term['name_us'],
+        "term_id": term['id'],
+        "points": 8
+    }
+
+def create_instruction_quizzes(terms: List[Dict], seed: Optional[int] = RANDOM_SEED) -> List[Dict]:
+    """Create quizzes based on instructions"""
+    distractors = build_distractor_engine(terms)
     quizzes = []
-    
     for term in terms:
-        if not term.get('id'):
-            continue
-            
-        # US vs UK terminology
-        if term.get('name_uk') and term['name_uk'] != term['name_us']:
-            quizzes.append({
-                "id": f"uk_{term['id']}",
-                "type": "terminology",
-                "category": "US_vs_UK",
-                "difficulty": "Intermediate",
-                "question": f"What is the UK term for '{term['name_us']}'?",
-                "answer": term['name_uk'],
-                "term_id": term['id'],
-                "points": 5
-            })
-        
-        # Abbreviation quiz
-        if term.get('abbreviation_us'):
-            quizzes.append({
-                "id": f"abbrev_{term['id']}",
-                "type": "abbreviation",
-                "category": term.get('category', 'Basic'),
-                "difficulty": "Beginner",
-                "question": f"What does '{term['abbreviation_us']}' stand for?",
-                "answer": term['name_us'],
-                "term_id": term['id'],
-                "points": 5
-            })
-    
+        rng = seeded_rng(seed, 'multiple_choice', term.get('id'))
+        quizzes.extend(q for q in (instruction_question(term), multiple_choice_question(term, distractors, rng)) if q)
     return quizzes
 
+def create_terminology_quizzes(terms: List[Dict]) -> List[Dict]:
+    """Create quizzes about terminology (US vs UK, abbreviations)"""
+    return [q for term in terms for q in (uk_term_question(term), abbreviation_question(term)) if q]
+
 def create_symbol_quizzes(terms: List[Dict]) -> List[Dict]:
     """Create quizzes about crochet symbols"""
-    quizzes = []
-    
-    terms_with_symbols = [t for t in terms if t.get('symbol')]
-    
-    for term in terms_with_symbols:
-        quizzes.append({
-            "id": f"symbol_{term['id']}",
-            "type": "symbol",
-            "category": "Symbols",
-            "difficulty": "Advanced",
-            "question": f"What stitch does this symbol represent: {term['symbol']}?",
-            "answer": term['name_us'],
-            "term_id": term['id'],
-            "points": 10
-        })
-    
-    return quizzes
+    return [q for q in map(symbol_question, terms) if q]
 
 def create_mixed_quizzes(terms: List[Dict]) -> List[Dict]:
     """Create mixed-difficulty comprehensive quizzes"""
-    quizzes = []
+    return [q for q in map(definition_question, terms) if q]
+
+def term_questions(term: Dict, distractors: Optional[DistractorEngine], seed: Optional[int] = RANDOM_SEED) -> List[Dict]:
+    """Every question built from one term, in QUESTION_GROUPS order"""
+    rng = seeded_rng(seed, 'multiple_choice', term.get('id'))
+    questions = [instruction_question(term),
+                 multiple_choice_question(term, distractors, rng) if distractors else None,
+                 uk_term_question(term), abbreviation_question(term),
+                 symbol_question(term), definition_question(term)]
+    return [q for q in questions if q]
+
+def multiple_choice_signature(term: Dict, distractors: DistractorEngine) -> Optional[str]:
+    """Hash of the answers a term's multiple-choice question draws from.
     
-    # Definition matching
-    for term in terms:
-        if term.get('description'):
-            quizzes.append({
-                "id": f"def_{term['id']}",
-                "type": "definition",
-                "category": term.get('category', 'Basic'),
-                "difficulty": term.get('difficulty', 'Beginner'),
-                "question": f"Which stitch matches this description: {term['description']}?",
-                "answer": term['name_us'],
-                "term_id": term['id'],
-                "points": 8
-            })
+    Distractors come from other terms, so an edit elsewhere in the category can
+    change this question even when the term itself is untouched.
+    """
+    if not term.get('instruction'):
+        return None
+    return content_hash(json.dumps(distractors.draw_pool(term['id']), ensure_ascii=False).encode('utf-8'))
+
+def load_question_cache(cache_file: str, seed: Optional[int]) -> Dict:
+    """Cached questions built with this seed and cache version ({} if unusable)"""
+    if seed is None:
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if cache.get('version') != QUESTION_CACHE_VERSION or cache.get('seed') != seed:
+        return {}
+    return cache
+
+def category_signatures(terms: List[Dict], hashes: List[str]) -> Dict[str, str]:
+    """category → hash of its instruction terms, in glossary order (what its distractor pools depend on)"""
+    groups = {}
+    for term, term_hash in zip(terms, hashes):
+        if term.get('instruction'):
+            groups.setdefault(term.get('category', ''), []).append(term_hash)
+    return {category: content_hash(''.join(group).encode('utf-8')) for category, group in groups.items()}
+
+def generate_all_quizzes(terms: List[Dict], seed: Optional[int] = RANDOM_SEED,
+                         cache_file: Optional[str] = QUESTION_CACHE_FILE) -> List[Dict]:
+    """All questions, rebuilding only terms whose content (or distractor pool) changed.
     
-    return quizzes
+    Same result as the create_*_quizzes functions in sequence. The distractor
+    engine is only built for categories whose instruction terms changed, and only
+    multiple-choice questions in those categories are re-checked.
+    """
+    cache = load_question_cache(cache_file, seed) if cache_file else {}
+    cached = cache.get('terms', {})
+    hashes = [canonical_hash(term) for term in terms]
+    signatures = category_signatures(terms, hashes)
+    previous = cache.get('categories', {})
+    changed_categories = {category for category, signature in signatures.items()
+                          if previous.get(category) != signature}
+    changed_categories.update(term.get('category', '') for term, term_hash in zip(terms, hashes)
+                              if term.get('instruction') and term_hash not in cached)
+    
+    distractors = None
+    if changed_categories:
+        distractors = build_distractor_engine([t for t in terms if t.get('category', '') in changed_categories])
+    
+    entries = {}
+    rebuilt = 0
+    for term, term_hash in zip(terms, hashes):
+        if term_hash in entries:
+            continue
+        entry = cached.get(term_hash)
+        signature = entry and entry['mc_signature']
+        if term.get('instruction') and term.get('category', '') in changed_categories:
+            signature = multiple_choice_signature(term, distractors)
+            if entry is not None and entry['mc_signature'] != signature:
+                entry = None
+        if entry is None:
+            entry = {"mc_signature": signature, "questions": term_questions(term, distractors, seed)}
+            rebuilt += 1
+        entries[term_hash] = entry
+    
+    removed = len(set(cached) - set(entries))
+    print(f"🧩 Questions: {len(entries) - rebuilt} terms reused, {rebuilt} rebuilt, {removed} removed "
+          f"({len(changed_categories)} of {len(signatures)} distractor categories re-checked)")
+    if cache_file and seed is not None:
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        write_json(cache_file, {"version": QUESTION_CACHE_VERSION, "seed": seed,
+                                "categories": signatures, "terms": entries}, minified=True)
+    
+    return [question for group in QUESTION_GROUPS for term_hash in hashes
+            for question in entries[term_hash]['questions'] if question['type'] in group]
 
-def organize_by_difficulty():
+def organize_by_difficulty(terms: Optional[List[Dict]] = None, seed: Optional[int] = RANDOM_SEED,
+                           cache_file: Optional[str] = QUESTION_CACHE_FILE):
     """Create quiz sets organized by difficulty level"""
-    terms = load_glossary_data()
+    if terms is None:
+        terms = load_glossary_data()
     if not terms:
         return
     
-    all_quizzes = []
-    all_quizzes.extend(create_instruction_quizzes(terms))
-    all_quizzes.extend(create_terminology_quizzes(terms))
-    all_quizzes.extend(create_symbol_quizzes(terms))
-    all_quizzes.extend(create_mixed_quizzes(terms))
+    all_quizzes = generate_all_quizzes(terms, seed, cache_file)
     
     # Organize by difficulty
     difficulty_sets = {
@@ -213,27 +322,28 @@ def organize_by_difficulty():
             "description": "Mixed questions from all skill levels",
             "total_questions": 50,
             "total_points": 500,
-            "questions": random.sample(all_quizzes, min(50, len(all_quizzes)))
+            "questions": seeded_rng(seed, 'master_challenge').sample(all_quizzes, min(50, len(all_quizzes)))
         }
     }
     
     return quiz_packages
 
-def create_quiz_files():
-    """Create all quiz-related files"""
-    print("Generating quiz files from glossary data...")
-    
-    terms = load_glossary_data()
+def build_quiz_data(glossary: Dict, seed: Optional[int] = RANDOM_SEED,
+                    cache_file: Optional[str] = QUESTION_CACHE_FILE) -> Optional[Dict]:
+    """The quiz.json document (every pack) for a loaded glossary.json; None if it has no terms"""
+    terms = glossary.get('terms', [])
     if not terms:
-        return
+        return None
     
-    # Create comprehensive quiz data
-    quiz_packages = organize_by_difficulty()
+    quiz_packages = organize_by_difficulty(terms, seed, cache_file)
     
-    # Main quiz file (updated)
-    quiz_data = {
+    # "generated" follows the glossary's data date, not the wall clock,
+    # so the same glossary and seed always give the same bytes
+    return {
         "version": "1.0",
-        "generated": "2025-07-12",
+        "generated": (glossary.get('last_updated') or date.today().isoformat())[:10],
+        "seed": seed,
+        "glossary_hash": glossary_content_hash(glossary),
         "total_packages": len(quiz_packages),
         "packages": quiz_packages,
         "api_info": {
@@ -241,26 +351,31 @@ def create_quiz_files():
             "usage": "Select a package and present questions to users"
         }
     }
-    
-    # Write quiz.json
-    with open('quiz.json', 'w', encoding='utf-8') as f:
-        json.dump(quiz_data, f, indent=2, ensure_ascii=False)
-    
-    # Create individual quiz files
+
+def quiz_questions(quiz_data: Dict) -> List[Dict]:
+    """Every distinct question across the packs, in pack order"""
+    questions = {}
+    for package in quiz_data.get('packages', {}).values():
+        for question in package['questions']:
+            questions.setdefault(question['id'], question)
+    return list(questions.values())
+
+def write_quiz_packages(quiz_data: Dict, terms: List[Dict]) -> Dict:
+    """Write quizzes/{package}.json and quizzes/quiz_stats.json; returns the stats"""
+    quiz_packages = quiz_data['packages']
     os.makedirs('quizzes', exist_ok=True)
     
     for package_name, package_data in quiz_packages.items():
-        filename = f'quizzes/{package_name}.json'
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(package_data, f, indent=2, ensure_ascii=False)
-        print(f"✅ Created {filename}")
+        write_json(f'quizzes/{package_name}.json', package_data)
     
     # Create quiz statistics
     stats = {
+        "seed": quiz_data["seed"],
+        "glossary_hash": quiz_data["glossary_hash"],
         "total_quizzes": sum(len(pkg['questions']) for pkg in quiz_packages.values()),
         "terms_with_instructions": len([t for t in terms if t.get('instruction')]),
         "terms_with_symbols": len([t for t in terms if t.get('symbol')]),
-        "categories": list(set(t.get('category', 'Basic') for t in terms)),
+        "categories": sorted(set(t.get('category', 'Basic') for t in terms)),
         "difficulty_breakdown": {
             diff: len(pkg['questions']) 
             for diff, pkg in zip(['Beginner', 'Intermediate', 'Advanced'], 
@@ -270,17 +385,36 @@ def create_quiz_files():
         }
     }
     
-    with open('quizzes/quiz_stats.json', 'w', encoding='utf-8') as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    write_json('quizzes/quiz_stats.json', stats)
+    return stats
+
+def create_quiz_files(seed: Optional[int] = RANDOM_SEED, cache_file: Optional[str] = QUESTION_CACHE_FILE):
+    """Create all quiz-related files"""
+    print("Generating quiz files from glossary data...")
+    
+    glossary = load_glossary()
+    quiz_data = build_quiz_data(glossary, seed, cache_file)
+    if quiz_data is None:
+        return
+    
+    # Write quiz.json (files whose bytes didn't change are left alone)
+    write_json('quiz.json', quiz_data)
+    stats = write_quiz_packages(quiz_data, glossary['terms'])
     
     print(f"\nQuiz generation complete!")
     print(f"📊 Total quiz questions: {stats['total_quizzes']}")
-    print(f"📚 Quiz packages: {len(quiz_packages)}")
+    print(f"📚 Quiz packages: {quiz_data['total_packages']}")
     print(f"📝 Terms with instructions: {stats['terms_with_instructions']}")
 
 def main():
-    create_quiz_files()
+    parser = argparse.ArgumentParser(description="Generate quiz packs from glossary.json")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED,
+                        help=f"Seed for choices and sampling (default {RANDOM_SEED})")
+    parser.add_argument('--random', action='store_true', help="Unseeded: different packs on every run")
+    parser.add_argument('--no-cache', action='store_true', help=f"Rebuild every question and skip {QUESTION_CACHE_FILE}")
+    args = parser.parse_args()
+    
+    create_quiz_files(None if args.random else args.seed, None if args.no_cache else QUESTION_CACHE_FILE)
 
 if __name__ == "__main__":
-    import os
     main()
\ No newline at end of file
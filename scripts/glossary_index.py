@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+In-memory lookup index over the exported glossary
+Loads glossary.json once and builds hash maps for constant-time term lookups
+"""
+
+import json
+from typing import Dict, List, Optional
+
+
+def load_glossary_terms(path: str = 'glossary.json') -> List[Dict]:
+    """Load the term list from either glossary.json layout"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    # export_from_sheets writes {"terms": [...]}, export_to_json_api writes {"data": {"terms": [...]}}
+    if 'terms' in data:
+        return data['terms']
+    return data.get('data', {}).get('terms', [])
+
+
+def _normalize(value) -> str:
+    """Lower-case and trim a lookup key"""
+    return str(value).strip().lower() if value else ''
+
+
+class GlossaryIndex:
+    """Hash-map index over glossary terms keyed by id, names, abbreviations and symbol"""
+
+    def __init__(self, terms: List[Dict]):
+        self.terms = terms
+        self.by_id: Dict[str, Dict] = {}
+        self.by_name: Dict[str, List[Dict]] = {}
+        self.by_abbreviation: Dict[str, List[Dict]] = {}
+        self.by_symbol: Dict[str, List[Dict]] = {}
+
+        for term in terms:
+            term_id = term.get('id')
+            if not term_id:
+                continue
+
+            # First occurrence wins, matching the sheet order
+            self.by_id.setdefault(term_id, term)
+
+            self._add(self.by_name, term.get('name_us'), term)
+            self._add(self.by_abbreviation, term.get('abbreviation_us'), term)
+            self._add(self.by_symbol, term.get('symbol'), term)
+
+        # UK names and abbreviations go second so a US match is always preferred,
+        # e.g. "double crochet" resolves to DC rather than the UK name of SC
+        for term in self.by_id.values():
+            self._add(self.by_name, term.get('name_uk'), term)
+            self._add(self.by_abbreviation, term.get('abbreviation_uk'), term)
+
+    @staticmethod
+    def _add(mapping: Dict[str, List[Dict]], value, term: Dict):
+        """Append a term under a normalized key, skipping blanks and repeats"""
+        key = _normalize(value)
+        if not key:
+            return
+        bucket = mapping.setdefault(key, [])
+        if not any(existing is term for existing in bucket):
+            bucket.append(term)
+
+    @classmethod
+    def from_file(cls, path: str = 'glossary.json') -> 'GlossaryIndex':
+        """Build an index from an exported glossary.json"""
+        return cls(load_glossary_terms(path))
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, term_id) -> bool:
+        return term_id in self.by_id
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def get(self, term_id: str, default=None) -> Optional[Dict]:
+        """Look up a term by its exact ID"""
+        return self.by_id.get(term_id, default)
+
+    def get_by_name(self, name: str) -> Optional[Dict]:
+        """Look up a term by US or UK name (case-insensitive)"""
+        matches = self.by_name.get(_normalize(name))
+        return matches[0] if matches else None
+
+    def get_by_abbreviation(self, abbreviation: str) -> Optional[Dict]:
+        """Look up a term by US or UK abbreviation (case-insensitive)"""
+        matches = self.by_abbreviation.get(_normalize(abbreviation))
+        return matches[0] if matches else None
+
+    def get_by_symbol(self, symbol: str) -> Optional[Dict]:
+        """Look up a term by chart symbol (case-insensitive)"""
+        matches = self.by_symbol.get(_normalize(symbol))
+        return matches[0] if matches else None
+
+    def resolve(self, text: str) -> Optional[Dict]:
+        """Resolve pattern text (ID, abbreviation, name or symbol) to a term"""
+        term = self.by_id.get(text)
+        if term:
+            return term
+
+        key = _normalize(text)
+        for mapping in (self.by_abbreviation, self.by_name, self.by_symbol):
+            matches = mapping.get(key)
+            if matches:
+                return matches[0]
+
+        # Pattern text is usually lower-case while sheet IDs are upper-case
+        return self.by_id.get(key.upper())
+
+    def find_all(self, text: str) -> List[Dict]:
+        """Return every term whose ID, name, abbreviation or symbol matches"""
+        key = _normalize(text)
+        results = []
+        candidates = [self.by_id.get(text), self.by_id.get(key.upper())]
+        for mapping in (self.by_abbreviation, self.by_name, self.by_symbol):
+            candidates.extend(mapping.get(key, []))
+
+        seen = set()
+        for term in candidates:
+            if term and id(term) not in seen:
+                seen.add(id(term))
+                results.append(term)
+        return results
+
+
+def main():
+    """Print a few sample lookups from glossary.json"""
+    index = GlossaryIndex.from_file('../glossary.json')
+    print(f"✅ Indexed {len(index)} terms")
+    print(f"   Names: {len(index.by_name)}, Abbreviations: {len(index.by_abbreviation)}, Symbols: {len(index.by_symbol)}")
+
+    for text in ['SC', 'sc', 'Double Crochet', 'hoth']:
+        term = index.resolve(text)
+        found = f"{term['id']} ({term['name_us']})" if term else "not found"
+        print(f"   🔍 {text} → {found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Local asyncio HTTP query server over the exported glossary artifacts
+Serves single terms, categories, search results and random quiz questions
+so clients no longer have to download whole JSON files to read one term
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from autocomplete_index import AutocompleteIndex
+from facet_index import FacetIndex, FacetQueryError
+from fuzzy_search import FuzzySearch
+from glossary_index import GlossaryIndex, load_glossary_terms
+
+# Configuration
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+KEEP_ALIVE_TIMEOUT = 15  # seconds an idle keep-alive connection is held open
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 64 * 1024  # request bodies are drained, never used; refuse anything larger
+DEFAULT_SEARCH_LIMIT = 20
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+RESPONSE_CACHE_SIZE = 2048
+
+STATUS_TEXT = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Content Too Large',
+}
+
+
+def load_json(path: str, default=None):
+    """Load a JSON artifact, returning default if it has not been exported"""
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def extract_quiz_questions(quiz_data) -> List[Dict]:
+    """Flatten quiz.json from either the export or the quiz generator layout"""
+    if not quiz_data:
+        return []
+    if 'questions' in quiz_data:
+        return quiz_data['questions']
+
+    questions = []
+    seen = set()
+    for package in quiz_data.get('packages', {}).values():
+        for question in package.get('questions', []):
+            if question.get('id') not in seen:
+                seen.add(question.get('id'))
+                questions.append(question)
+    return questions
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body"""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)"""
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class GlossaryQueryServer:
+    """Routes HTTP queries to in-memory copies of the exported artifacts"""
+
+    def __init__(self, data_dir: str = '.'):
+        self.data_dir = data_dir
+        self.response_cache: Dict[str, Tuple[int, bytes, str]] = {}
+        self.load()
+
+    def load(self):
+        """(Re)load every artifact from the data directory"""
+        glossary_path = os.path.join(self.data_dir, 'glossary.json')
+        categories = load_json(os.path.join(self.data_dir, 'categories.json'), {})
+        quiz = load_json(os.path.join(self.data_dir, 'quiz.json'), {})
+
+        # Either glossary.json layout (export_from_sheets or export_to_json_api)
+        self.index = GlossaryIndex(load_glossary_terms(glossary_path) if os.path.exists(glossary_path) else [])
+        autocomplete_path = os.path.join(self.data_dir, 'autocomplete.json')
+        if os.path.exists(autocomplete_path):
+            self.autocomplete = AutocompleteIndex.from_file(autocomplete_path)
+        else:
+            self.autocomplete = AutocompleteIndex.from_terms(self.index.terms)
+        self.fuzzy = FuzzySearch(self.index.terms)
+        self.facets = FacetIndex(self.index.terms)
+        # Category names are matched case-insensitively, so "Pattern" and "pattern" merge
+        self.categories: Dict[str, List[Dict]] = {}
+        for name, terms in categories.get('terms_by_category', {}).items():
+            self.categories.setdefault(name.lower(), []).extend(terms)
+        self.quiz_questions = extract_quiz_questions(quiz)
+        self.response_cache.clear()
+
+        print(f"✅ Loaded {len(self.index)} terms, {len(self.categories)} categories, "
+              f"{len(self.quiz_questions)} quiz questions from {os.path.abspath(self.data_dir)}")
+
+    # ---- Routing ---------------------------------------------------------
+
+    def route(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, object, bool]:
+        """Return (status, payload, cacheable) for a request path"""
+        parts = [unquote(p) for p in path.strip('/').split('/') if p]
+
+        if len(parts) == 2 and parts[0] == 'terms':
+            term = self.index.get(parts[1]) or self.index.resolve(parts[1])
+            if term:
+                return 200, term, True
+            return 404, {'error': f"Term '{parts[1]}' not found"}, True
+
+        if len(parts) == 2 and parts[0] == 'categories':
+            terms = self.categories.get(parts[1].lower())
+            if terms is not None:
+                return 200, {'category': parts[1], 'total': len(terms), 'terms': terms}, True
+            return 404, {'error': f"Category '{parts[1]}' not found"}, True
+
+        if parts == ['search']:
+            q = query.get('q', [''])[0].strip()
+            if not q:
+                return 400, {'error': "Missing query parameter 'q'"}, True
+            limit = self._int_param(query, 'limit', DEFAULT_SEARCH_LIMIT)
+            results = self.search(q, limit)
+            if results:
+                return 200, {'query': q, 'total': len(results), 'results': results}, True
+
+            # Nothing contains the query verbatim, so fall back to typo-tolerant matching
+            results = [term for term, _ in self.fuzzy.search(q, limit)]
+            return 200, {'query': q, 'total': len(results), 'fuzzy': True, 'results': results}, True
+
+        if parts == ['autocomplete']:
+            q = query.get('q', [''])[0]
+            limit = self._int_param(query, 'limit', DEFAULT_AUTOCOMPLETE_LIMIT)
+            return 200, {'query': q, 'completions': self.autocomplete.complete(q, limit)}, True
+
+        if parts == ['facets']:
+            expression = query.get('filter', [''])[0]
+            limit = self._int_param(query, 'limit', DEFAULT_SEARCH_LIMIT)
+            try:
+                return 200, self.facets.query(expression, limit), True
+            except FacetQueryError as e:
+                return 400, {'error': str(e)}, True
+
+        if parts == ['quiz', 'random']:
+            if not self.quiz_questions:
+                return 404, {'error': 'No quiz questions exported'}, False
+            return 200, random.choice(self.quiz_questions), False
+
+        if not parts:
+            return 200, {
+                'endpoints': ['/terms/{id}', '/categories/{name}', '/search?q=', '/autocomplete?q=', '/facets?filter=', '/quiz/random'],
+                'total_terms': len(self.index),
+            }, True
+
+        return 404, {'error': f"Unknown endpoint '{path}'"}, True
+
+    @staticmethod
+    def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+        """Parse a positive integer query parameter"""
+        try:
+            return max(1, int(query.get(name, [default])[0]))
+        except ValueError:
+            return default
+
+    def search(self, q: str, limit: int) -> List[Dict]:
+        """Substring search over names and tags, as documented in the README"""
+        q = q.lower()
+        results = []
+        for term in self.index:
+            if (q in term.get('name_us', '').lower()
+                    or q in term.get('name_uk', '').lower()
+                    or any(q in tag.lower() for tag in term.get('tags', []))):
+                results.append(term)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def render(self, target: str) -> Tuple[int, bytes, Optional[str]]:
+        """Render a request target to (status, body, etag), caching static responses"""
+        cached = self.response_cache.get(target)
+        if cached:
+            return cached
+
+        url = urlsplit(target)
+        status, payload, cacheable = self.route(url.path, parse_qs(url.query))
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+        if not cacheable:
+            return status, body, None
+
+        response = (status, body, make_etag(body))
+        if len(self.response_cache) >= RESPONSE_CACHE_SIZE:
+            self.response_cache.clear()
+        self.response_cache[target] = response
+        return response
+
+    # ---- HTTP/1.1 connection handling -------------------------------------
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes or idles out"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.send(writer, 400, b'{"error": "Malformed request line"}', None, False)
+                    break
+
+                try:
+                    headers = await asyncio.wait_for(self.read_headers(reader), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if headers is None:
+                    break
+
+                # Drain any request body so the next pipelined request parses cleanly
+                length = headers.get('content-length', '0') or '0'
+                if not (length.isascii() and length.isdigit()):
+                    await self.send(writer, 400, b'{"error": "Invalid Content-Length"}', None, False)
+                    break
+                length = int(length)
+                if length > MAX_BODY_BYTES:
+                    await self.send(writer, 413, b'{"error": "Request body too large"}', None, False)
+                    break
+                if length:
+                    await asyncio.wait_for(reader.readexactly(length), KEEP_ALIVE_TIMEOUT)
+
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.0':
+                    keep_alive = connection == 'keep-alive'
+                else:
+                    keep_alive = connection != 'close'
+
+                if method not in ('GET', 'HEAD'):
+                    await self.send(writer, 405, b'{"error": "Method not allowed"}', None, keep_alive)
+                else:
+                    status, body, etag = self.render(target)
+                    if etag and status == 200 and etag_matches(headers.get('if-none-match', ''), etag):
+                        await self.send(writer, 304, b'', etag, keep_alive)
+                    else:
+                        await self.send(writer, status, body, etag, keep_alive, head=method == 'HEAD')
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def read_headers(reader: asyncio.StreamReader) -> Optional[Dict[str, str]]:
+        """Read request headers into a lower-cased dict"""
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if not line:
+                return None
+            line = line.decode('latin-1').strip()
+            if not line:
+                return headers
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        return None
+
+    @staticmethod
+    async def send(writer: asyncio.StreamWriter, status: int, body: bytes,
+                   etag: Optional[str], keep_alive: bool, head: bool = False):
+        """Write one HTTP response"""
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}",
+            "Content-Type: application/json; charset=utf-8",
+            "Access-Control-Allow-Origin: *",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        # A 304 may only repeat the 200's length, so it carries none
+        if status != 304:
+            lines.insert(2, f"Content-Length: {len(body)}")
+        if etag:
+            lines.append(f"ETag: {etag}")
+            lines.append("Cache-Control: no-cache")
+        else:
+            lines.append("Cache-Control: no-store")
+        if keep_alive:
+            lines.append(f"Keep-Alive: timeout={KEEP_ALIVE_TIMEOUT}")
+
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if not head and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Run the server until cancelled"""
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"🧶 Serving glossary on http://{host}:{port}/")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Start the query server"""
+    parser = argparse.ArgumentParser(description="Serve exported glossary artifacts over HTTP")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--data-dir', default='.', help="Directory containing the exported JSON files")
+    args = parser.parse_args()
+
+    server = GlossaryQueryServer(args.data_dir)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+
+
+if __name__ == "__main__":
+    main()
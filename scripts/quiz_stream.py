@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+On-demand quiz question streams
+A QuestionPool indexes every (question type, term) pair the glossary supports
+once; each stream then walks a fresh shuffle of the matching pairs and builds
+questions only as they are pulled. No question repeats until the whole
+filtered pool has been served (a type mix only changes the order within a
+pass), and after that every pass reshuffles and redraws the multiple-choice
+distractors. Memory is bounded by the pool size,
+not by how many questions a session pulls.
+"""
+
+import argparse
+import random
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from generate_quizzes import (abbreviation_question, build_distractor_engine, definition_question,
+                              instruction_question, load_glossary_data, multiple_choice_question,
+                              seeded_rng, symbol_question, uk_term_question)
+
+# Question type → per-term builder (multiple choice also needs distractors and an rng)
+QUESTION_TYPES = {
+    "instruction": instruction_question,
+    "multiple_choice": multiple_choice_question,
+    "terminology": uk_term_question,
+    "abbreviation": abbreviation_question,
+    "symbol": symbol_question,
+    "definition": definition_question,
+}
+
+TypeMix = Union[Iterable[str], Dict[str, float]]
+
+
+def _as_filter(value) -> Optional[set]:
+    """None → no filter; 'x' → {'x'}; ['x', 2] → {'x', '2'}"""
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return {str(value)}
+    return {str(v) for v in value}
+
+
+class QuestionPool:
+    """Every question the glossary can produce, indexed by type as term positions"""
+
+    def __init__(self, terms: List[Dict]):
+        # First term wins on duplicate IDs, as in GlossaryIndex and DistractorEngine
+        unique = {}
+        for term in terms:
+            if term.get('id'):
+                unique.setdefault(term['id'], term)
+        self.terms = list(unique.values())
+        self.distractors = build_distractor_engine(self.terms)
+
+        # type → [(term index, category, difficulty)]; the questions themselves aren't kept
+        self.entries: Dict[str, List[Tuple[int, str, str]]] = {}
+        rng = random.Random(0)
+        for qtype in QUESTION_TYPES:
+            entries = self.entries[qtype] = []
+            for index in range(len(self.terms)):
+                question = self._build(qtype, index, rng)
+                if question:
+                    entries.append((index, str(question['category']), str(question['difficulty'])))
+
+    def _build(self, qtype: str, index: int, rng: random.Random) -> Optional[Dict]:
+        term = self.terms[index]
+        if qtype == "multiple_choice":
+            return multiple_choice_question(term, self.distractors, rng)
+        return QUESTION_TYPES[qtype](term)
+
+    def size(self, **filters) -> Dict[str, int]:
+        """Matching questions per type for stream(**filters)"""
+        return {qtype: len(indexes) for qtype, indexes in self._select(**filters).items()}
+
+    def _select(self, difficulty=None, category=None, types: Optional[TypeMix] = None) -> Dict[str, List[int]]:
+        difficulties, categories = _as_filter(difficulty), _as_filter(category)
+        wanted = QUESTION_TYPES if types is None else types
+        unknown = [qtype for qtype in wanted if qtype not in QUESTION_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown question type(s) {', '.join(unknown)} (use {', '.join(QUESTION_TYPES)})")
+
+        selected = {}
+        for qtype in wanted:
+            indexes = [index for index, cat, diff in self.entries[qtype]
+                       if (categories is None or cat in categories)
+                       and (difficulties is None or diff in difficulties)]
+            if indexes:
+                selected[qtype] = indexes
+        return selected
+
+    def stream(self, difficulty=None, category=None, types: Optional[TypeMix] = None,
+               seed: Optional[int] = None) -> Iterator[Dict]:
+        """Unbounded questions matching the filters; empty if nothing matches.
+
+        difficulty/category match the question's own fields (one value or several).
+        types is a list of question types (equal shares) or {type: weight}; by
+        default every matching question is equally likely, whatever its type.
+        Either way each pass serves every matching question once before any repeats:
+        weights decide how early in the pass a type is drawn, and a type whose
+        questions are used up sits out until the others are too.
+        The same seed replays the same stream; None gives a fresh one each call.
+        """
+        selected = self._select(difficulty, category, types)
+        weights = types if isinstance(types, dict) else {}
+        selected = {qtype: indexes for qtype, indexes in selected.items() if weights.get(qtype, 1) > 0}
+        if not selected:
+            return
+
+        rng = seeded_rng(seed, 'stream')
+        if types is None:
+            # One shuffle over every (type, term) pair
+            cursor = _Cycle([(qtype, index) for qtype, indexes in selected.items() for index in indexes], rng)
+            while True:
+                (qtype, index), cycle = cursor.next()
+                yield from self._stream_question(qtype, index, cycle, seed)
+
+        cursors = {qtype: _Cycle(indexes, rng) for qtype, indexes in selected.items()}
+        while True:
+            pending = list(cursors)
+            while pending:
+                shares = [float(weights.get(qtype, 1)) for qtype in pending]
+                qtype = pending[0] if len(pending) == 1 else rng.choices(pending, shares)[0]
+                cursor = cursors[qtype]
+                index, cycle = cursor.next()
+                if cursor.exhausted():
+                    pending.remove(qtype)
+                yield from self._stream_question(qtype, index, cycle, seed)
+
+    def _stream_question(self, qtype: str, index: int, cycle: int, seed: Optional[int]) -> Iterator[Dict]:
+        # Multiple-choice distractors and order are redrawn every cycle
+        question = self._build(qtype, index, seeded_rng(seed, 'stream', cycle, self.terms[index]['id']))
+        if question:
+            yield question
+
+
+class _Cycle:
+    """Endless walk over a list, reshuffled each pass, never repeating across a pass boundary"""
+
+    def __init__(self, items: List, rng: random.Random):
+        self.order = list(items)
+        self.rng = rng
+        self.position = len(self.order)
+        self.cycle = -1
+
+    def exhausted(self) -> bool:
+        """True once the current pass has served every item"""
+        return self.position == len(self.order) and self.cycle >= 0
+
+    def next(self) -> Tuple[object, int]:
+        if self.position == len(self.order):
+            last = self.order[-1] if self.cycle >= 0 else None
+            self.rng.shuffle(self.order)
+            if len(self.order) > 1 and self.order[0] == last:
+                self.order[0], self.order[-1] = self.order[-1], self.order[0]
+            self.position = 0
+            self.cycle += 1
+        item = self.order[self.position]
+        self.position += 1
+        return item, self.cycle
+
+
+def question_stream(terms: Optional[List[Dict]] = None, difficulty=None, category=None,
+                    types: Optional[TypeMix] = None, seed: Optional[int] = None) -> Iterator[Dict]:
+    """One-off stream; build a QuestionPool instead to serve many sessions from one index"""
+    if terms is None:
+        terms = load_glossary_data()
+    return QuestionPool(terms).stream(difficulty, category, types, seed)
+
+
+def main():
+    """Print questions from a stream, e.g. quiz_stream.py 10 --type multiple_choice --type definition"""
+    import time
+
+    parser = argparse.ArgumentParser(description="Stream quiz questions from glossary.json")
+    parser.add_argument('count', nargs='?', type=int, default=10, help="Questions to print (default 10)")
+    parser.add_argument('--difficulty', action='append', help="Question difficulty (repeatable)")
+    parser.add_argument('--category', action='append', help="Question category (repeatable)")
+    parser.add_argument('--type', action='append', dest='types', choices=list(QUESTION_TYPES),
+                        help="Question type (repeatable; default all)")
+    parser.add_argument('--seed', type=int, help="Replay a stream (default: fresh every run)")
+    args = parser.parse_args()
+
+    terms = load_glossary_data()
+    if not terms:
+        return
+
+    start = time.perf_counter()
+    pool = QuestionPool(terms)
+    filters = dict(difficulty=args.difficulty, category=args.category, types=args.types)
+    sizes = pool.size(**filters)
+    print(f"🎲 {sum(sizes.values())} matching questions "
+          f"({', '.join(f'{t}: {n}' for t, n in sizes.items()) or 'none'}), "
+          f"pool built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for number, question in enumerate(islice(pool.stream(seed=args.seed, **filters), args.count), 1):
+        print(f"{number:>4}. [{question['type']}] {question['question']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Compiled sheet-row → term mapper
+The header layout is resolved once into (column index, API field, converter)
+tuples, which are then compiled into one specialized row-to-term function,
+so the per-row work is a single dict build with no lookups or closures.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Complete field mapping: Google Sheets → API field names (other headers are lower-cased)
+FIELD_MAPPING = {
+    "Status": "status",
+    "Symbol": "symbol",
+    "Category": "category",
+    "Tags": "tags",
+    "Description": "description",
+    "Priority": "priority",
+    "Difficulty": "difficulty",
+    "Instruction": "instruction",
+    "Time_To_Learn": "estimated_learning_time",
+    "Best_For": "best_use_cases",
+    "Common_Mistakes": "common_mistakes",
+    "Pro_Tips": "pro_tips",
+    "Hook_Sizes": "hook_sizes",
+    "Left_Handed_Note": "left_handed_note",
+    "Abbrev_US": "abbreviation_us",
+    "Abbrev_UK": "abbreviation_uk"
+}
+
+# Handled explicitly: they lead every term and Name_UK falls back to Name_US
+KEY_HEADERS = ("ID", "Name_US", "Name_UK")
+
+# Columns the rest of the export reads from every term
+EXPECTED_HEADERS = KEY_HEADERS + ("Category", "Tags", "Difficulty", "Instruction")
+
+
+def split_tags(value: str) -> List[str]:
+    """'a, b,,c ' → ['a', 'b', 'c']"""
+    return [tag.strip() for tag in value.split(",") if tag.strip()] if value else []
+
+
+DEFAULT_CONVERTERS = {"tags": split_tags}
+
+Column = Tuple[int, str, Optional[Callable]]
+
+
+class RowMapper:
+    """Row-to-term conversion compiled for one header layout"""
+
+    def __init__(self, headers: List[str], field_mapping: Dict[str, str] = FIELD_MAPPING,
+                 converters: Dict[str, Callable] = DEFAULT_CONVERTERS):
+        self.headers = list(headers)
+        self.converters = converters
+
+        # Like a header → index dict, a repeated header reads its last column
+        col_indices = {header: i for i, header in enumerate(self.headers)}
+        self.key_columns = {header: col_indices.get(header) for header in KEY_HEADERS}
+        self.columns: List[Column] = [
+            (col_indices[header], field, converters.get(field))
+            for header in self.headers if header not in KEY_HEADERS
+            for field in [field_mapping.get(header, header.lower())]
+        ]
+
+        self.auto_named = [header for header in dict.fromkeys(self.headers)
+                           if header not in KEY_HEADERS and header not in field_mapping]
+        self.duplicate_headers = sorted({h for h in self.headers if self.headers.count(h) > 1})
+        self.missing_headers = [h for h in EXPECTED_HEADERS if h not in col_indices]
+        self.stats = {"rows": 0, "skipped_short": 0, "skipped_no_id": 0, "terms": 0}
+
+        self.source, self.map_row = self._compile()
+
+    def _compile(self):
+        """Generate map_row(row) for this layout"""
+        width = len(self.headers)
+        namespace = {"PAD": [""] * width}
+
+        def cell(index: Optional[int]) -> str:
+            return f"row[{index}]" if index is not None else '""'
+
+        id_expr = cell(self.key_columns["ID"])
+        us_expr = cell(self.key_columns["Name_US"])
+        uk_index = self.key_columns["Name_UK"]
+        # get_cell("Name_UK", name_us): the fallback only applies when the cell is absent
+        uk_expr = f"({cell(uk_index)} if n > {uk_index} else {us_expr})" if uk_index is not None else us_expr
+
+        items = [f'"id": {id_expr}', f'"name_us": {us_expr}', f'"name_uk": {uk_expr}']
+        fields = set()
+        for index, field, converter in self.columns:
+            expr = cell(index)
+            if converter is not None:
+                name = f"convert_{len(namespace)}"
+                namespace[name] = converter
+                expr = f"{name}({expr})"
+            items.append(f"{field!r}: {expr}")
+            fields.add(field)
+        for field, converter in self.converters.items():
+            if field not in fields:
+                name = f"convert_{len(namespace)}"
+                namespace[name] = converter
+                items.append(f'{field!r}: {name}("")')
+
+        body = ",\n        ".join(items)
+        source = (
+            "def map_row(row):\n"
+            "    n = len(row)\n"
+            "    if n < 2:\n"
+            "        return None\n"
+            f"    if n < {width}:\n"
+            "        row = row + PAD[n:]\n"
+            "    return {\n"
+            f"        {body}\n"
+            "    }\n"
+        )
+        exec(compile(source, f"<row mapper: {width} columns>", "exec"), namespace)
+        return source, namespace["map_row"]
+
+    def map_rows(self, data_rows: Iterable[List[str]]) -> Iterator[Dict]:
+        """Terms for every row long enough to read and with an ID, updating stats"""
+        map_row = self.map_row
+        stats = self.stats
+        for row in data_rows:
+            stats["rows"] += 1
+            term = map_row(row)
+            if term is None:
+                stats["skipped_short"] += 1
+            elif not term["id"]:
+                stats["skipped_no_id"] += 1
+            else:
+                stats["terms"] += 1
+                yield term
+
+    def print_stats(self):
+        """Column mapping and row counts"""
+        explicit = len(self.columns) - len(self.auto_named)
+        print(f"🗺️  Row mapper: {len(self.headers)} columns → {len(self.columns) + 3} fields "
+              f"({explicit} mapped, {len(self.auto_named)} auto-named)")
+        if self.auto_named:
+            print(f"   Auto-named: {', '.join(f'{h} → {h.lower()}' for h in self.auto_named)}")
+        if self.duplicate_headers:
+            print(f"   ⚠️  Duplicate headers (last column wins): {', '.join(self.duplicate_headers)}")
+        if self.missing_headers:
+            print(f"   ⚠️  Missing columns: {', '.join(self.missing_headers)}")
+        stats = self.stats
+        print(f"   Rows: {stats['rows']} read, {stats['terms']} terms, "
+              f"{stats['skipped_short']} too short, {stats['skipped_no_id']} without ID")
+
+
+def main():
+    """Time the compiled mapper on a synthetic sheet"""
+    import time
+
+    headers = ["ID", "Status", "Name_US", "Name_UK", "Symbol", "Category", "Tags", "Abbrev_US",
+               "Abbrev_UK", "Description", "Priority", "Difficulty", "Instruction", "Time_To_Learn"]
+    rows = [[f"T{i}", "New", f"Term {i}", f"Term UK {i}", "", "Basic", "basic, stitch, easy", "",
+             "", "A stitch", "High", "2", "Yarn over and pull through"][:8 + i % 6] for i in range(100000)]
+
+    start = time.perf_counter()
+    mapper = RowMapper(headers)
+    terms = list(mapper.map_rows(rows))
+    elapsed = time.perf_counter() - start
+    mapper.print_stats()
+    print(f"   {len(terms):,} terms in {elapsed * 1000:.0f} ms ({elapsed / len(rows) * 1e6:.2f} µs/row)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Pluggable sources for the glossary sheet rows
+Every backend returns the same (headers, rows) shape as the Sheets API
+values().get() call: a header list plus lists of strings with trailing empty
+cells trimmed. Local CSV/XLSX/JSON snapshots let the exporters run offline.
+XLSX support needs openpyxl; the live sheet needs the Google API client.
+"""
+
+import argparse
+import csv
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+from sheets_service import build_sheets_service
+
+# Configuration
+SPREADSHEET_ID = '1WXt17J7Bn7nuRG3SV1HvvoWX4mvgZmY7dAeLRIlIh3A'
+RANGE_NAME = 'Sheet1!A:Z'
+CREDENTIALS_FILE = 'credentials.json'
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+
+# Set to a snapshot path (.csv, .xlsx or .json) to export without network access
+ROW_SOURCE_ENV = 'GLOSSARY_ROW_SOURCE'
+DEFAULT_SNAPSHOT = 'snapshots/sheet.csv'
+
+SNAPSHOT_FORMATS = ('.csv', '.xlsx', '.json')
+
+Rows = Tuple[List[str], List[List[str]]]
+
+
+def _cell_text(value) -> str:
+    """Spreadsheet cell as the string the Sheets API would return"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _trim(row: List[str]) -> List[str]:
+    """Drop trailing empty cells, like the Sheets API does"""
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return row[:end]
+
+
+def _split(values: List[List[str]]) -> Rows:
+    if not values:
+        return [], []
+    return values[0], values[1:]
+
+
+class SheetsSource:
+    """Live Google Sheet (needs credentials and network access, unless the fake backend is selected)"""
+
+    def __init__(self, spreadsheet_id: str = SPREADSHEET_ID, range_name: str = RANGE_NAME,
+                 credentials_file: str = CREDENTIALS_FILE, scopes: List[str] = SCOPES):
+        self.spreadsheet_id = spreadsheet_id
+        self.range_name = range_name
+        self.credentials_file = credentials_file
+        self.scopes = scopes
+
+    def __str__(self):
+        return f"Google Sheets {self.spreadsheet_id} ({self.range_name})"
+
+    def read(self) -> Rows:
+        sheet = build_sheets_service(self.credentials_file, self.scopes).spreadsheets()
+        result = sheet.values().get(spreadsheetId=self.spreadsheet_id, range=self.range_name).execute()
+        return _split(result.get('values', []))
+
+
+class SnapshotSource:
+    """Local snapshot of the sheet: .csv, .xlsx (first worksheet) or .json"""
+
+    def __init__(self, path: str):
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unsupported snapshot format {ext!r} (use {', '.join(SNAPSHOT_FORMATS)})")
+        self.path = path
+        self.format = ext
+
+    def __str__(self):
+        return f"snapshot {self.path}"
+
+    def read(self) -> Rows:
+        if self.format == '.csv':
+            with open(self.path, 'r', encoding='utf-8', newline='') as f:
+                return _split([_trim(row) for row in csv.reader(f)])
+
+        if self.format == '.xlsx':
+            if openpyxl is None:
+                raise RuntimeError("Reading .xlsx snapshots needs openpyxl (pip install openpyxl)")
+            workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+            try:
+                sheet = workbook.worksheets[0]
+                return _split([_trim([_cell_text(v) for v in row]) for row in sheet.iter_rows(values_only=True)])
+            finally:
+                workbook.close()
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Either the raw values().get() response or {"headers": [...], "rows": [...]}
+        if 'headers' in data:
+            return data['headers'], data.get('rows', [])
+        return _split(data.get('values', []))
+
+
+def open_row_source(path: Optional[str] = None):
+    """Snapshot at path (or $GLOSSARY_ROW_SOURCE) if given, otherwise the live sheet"""
+    path = path or os.environ.get(ROW_SOURCE_ENV)
+    return SnapshotSource(path) if path else SheetsSource()
+
+
+def read_rows(source=None) -> Rows:
+    """(headers, data_rows) from a source object, a snapshot path, or the default source"""
+    if source is None or isinstance(source, str):
+        source = open_row_source(source)
+    headers, data_rows = source.read()
+    print(f"Found {len(data_rows)} rows in {source}")
+    return headers, data_rows
+
+
+def rows_to_records(headers: List[str], data_rows: List[List[str]]) -> List[Dict[str, str]]:
+    """Header-keyed dicts of the non-empty, stripped cells; rows without an ID are skipped"""
+    records = []
+    for row in data_rows:
+        if not row:
+            continue
+        record = {}
+        for col_idx, header in enumerate(headers):
+            if col_idx < len(row) and row[col_idx].strip():
+                record[header] = row[col_idx].strip()
+        if record.get('ID'):
+            records.append(record)
+    return records
+
+
+def save_snapshot(headers: List[str], data_rows: List[List[str]], path: str = DEFAULT_SNAPSHOT) -> int:
+    """Write a snapshot that SnapshotSource reads back as the same (headers, rows)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unsupported snapshot format {ext!r} (use {', '.join(SNAPSHOT_FORMATS)})")
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if ext == '.csv':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows([headers] + data_rows)
+    elif ext == '.xlsx':
+        if openpyxl is None:
+            raise RuntimeError("Writing .xlsx snapshots needs openpyxl (pip install openpyxl)")
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet('Sheet1')
+        for row in [headers] + data_rows:
+            sheet.append(row)
+        workbook.save(path)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"headers": headers, "rows": data_rows}, f, indent=2, ensure_ascii=False)
+
+    size = os.path.getsize(path)
+    print(f"✅ Saved {len(data_rows)} rows to {path} ({size} bytes)")
+    return size
+
+
+def main():
+    """save-snapshot: copy the live sheet (or another snapshot) to a local file"""
+    parser = argparse.ArgumentParser(description="Glossary sheet row sources")
+    commands = parser.add_subparsers(dest='command', required=True)
+    save = commands.add_parser('save-snapshot', help="Save the sheet rows to a local .csv/.xlsx/.json file")
+    save.add_argument('path', nargs='?', default=DEFAULT_SNAPSHOT)
+    save.add_argument('--source', help="Read from this snapshot instead of the live sheet")
+    args = parser.parse_args()
+
+    if args.command == 'save-snapshot':
+        headers, data_rows = read_rows(args.source or SheetsSource())
+        if not headers:
+            print("❌ No data found")
+            return
+        save_snapshot(headers, data_rows, args.path)
+
+
+if __name__ == "__main__":
+    main()
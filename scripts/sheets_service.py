@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Google Sheets service factory with an in-process fake backend
+build_sheets_service() returns the real googleapiclient service, or, with
+GLOSSARY_SHEETS_BACKEND=fake, an in-memory grid that implements the
+values().get/update/batchUpdate/append(...).execute() calls our scripts make.
+The fake can inject latency and quota errors for benchmarking batching and retries.
+"""
+
+import os
+import random
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Configuration
+SHEETS_BACKEND_ENV = 'GLOSSARY_SHEETS_BACKEND'            # 'google' (default) or 'fake'
+FAKE_SNAPSHOT_ENV = 'GLOSSARY_FAKE_SHEETS_SNAPSHOT'       # .csv/.xlsx/.json to seed Sheet1 from
+FAKE_LATENCY_ENV = 'GLOSSARY_FAKE_SHEETS_LATENCY'         # seconds added to every execute()
+FAKE_ERROR_RATE_ENV = 'GLOSSARY_FAKE_SHEETS_ERROR_RATE'   # probability of a 429 per execute()
+FAKE_SEED_ENV = 'GLOSSARY_FAKE_SHEETS_SEED'
+
+DEFAULT_SHEET = 'Sheet1'
+
+_A1_PART = re.compile(r'^([A-Za-z]*)(\d*)$')
+
+# One fake per process, so scripts that build a service per call share a grid
+_fake_service = None
+
+
+class FakeHttpError(Exception):
+    """Stand-in for googleapiclient.errors.HttpError (exposes resp.status like it)"""
+
+    class _Resp:
+        def __init__(self, status: int, reason: str):
+            self.status = status
+            self.reason = reason
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"<HttpError {status}: {message}>")
+        self.resp = self._Resp(status, message)
+        self.status_code = status
+
+
+def column_index(letters: str) -> int:
+    """A → 0, Z → 25, AA → 26"""
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + (ord(ch) - ord('A') + 1)
+    return index - 1
+
+
+def column_letters(index: int) -> str:
+    """0 → A, 26 → AA"""
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+def parse_a1(range_name: str) -> Tuple[str, int, int, Optional[int], Optional[int]]:
+    """'Sheet1!A2:Q10' → (sheet, first row, first col, last row, last col), 0-based and inclusive
+
+    Open ends ('A:Z', '1:1', 'A5:Q') come back as None. Without a 'Sheet!' prefix
+    the sheet is DEFAULT_SHEET; FakeSheetsService resolves bare names against its grid.
+    """
+    sheet, _, cells = range_name.rpartition('!')
+    sheet = sheet.strip("'") or DEFAULT_SHEET
+    if not cells:
+        return sheet, 0, 0, None, None
+    start, _, end = cells.partition(':')
+    end = end or start
+
+    bounds = []
+    for part in (start, end):
+        match = _A1_PART.match(part)
+        if not match:
+            raise FakeHttpError(400, f"Unable to parse range: {range_name}")
+        letters, digits = match.groups()
+        bounds.append((int(digits) - 1 if digits else None, column_index(letters) if letters else None))
+    (first_row, first_col), (last_row, last_col) = bounds
+    return sheet, first_row or 0, first_col or 0, last_row, last_col
+
+
+def a1_range(sheet: str, first_row: int, first_col: int, last_row: int, last_col: int) -> str:
+    return f"{sheet}!{column_letters(first_col)}{first_row + 1}:{column_letters(last_col)}{last_row + 1}"
+
+
+def _trim(row: List[str]) -> List[str]:
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return row[:end]
+
+
+class _Request:
+    """Deferred call, run by execute() like an HttpRequest"""
+
+    def __init__(self, service: 'FakeSheetsService', method: str, call):
+        self._service = service
+        self._method = method
+        self._call = call
+
+    def execute(self, num_retries: int = 0, **kwargs):
+        for attempt in range(num_retries + 1):
+            try:
+                self._service._before_execute(self._method)
+                return self._call()
+            except FakeHttpError as e:
+                if e.resp.status != 429 or attempt == num_retries:
+                    raise
+                time.sleep(min(2 ** attempt * 0.1, 2))
+
+
+class _FakeValues:
+    def __init__(self, service: 'FakeSheetsService'):
+        self._service = service
+
+    def get(self, spreadsheetId: str, range: str, **kwargs):
+        return _Request(self._service, 'get', lambda: self._service.read_range(range))
+
+    def update(self, spreadsheetId: str, range: str, body: Dict, valueInputOption: str = 'RAW', **kwargs):
+        return _Request(self._service, 'update',
+                        lambda: {"spreadsheetId": spreadsheetId,
+                                 **self._service.write_range(range, body.get('values', []))})
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict, **kwargs):
+        def call():
+            responses = [self._service.write_range(item['range'], item.get('values', []))
+                         for item in body.get('data', [])]
+            return {
+                "spreadsheetId": spreadsheetId,
+                "totalUpdatedRows": sum(r['updatedRows'] for r in responses),
+                "totalUpdatedColumns": max((r['updatedColumns'] for r in responses), default=0),
+                "totalUpdatedCells": sum(r['updatedCells'] for r in responses),
+                "totalUpdatedSheets": len({r['updatedRange'].split('!')[0] for r in responses}),
+                "responses": responses,
+            }
+        return _Request(self._service, 'batchUpdate', call)
+
+    def append(self, spreadsheetId: str, range: str, body: Dict, valueInputOption: str = 'RAW', **kwargs):
+        return _Request(self._service, 'append',
+                        lambda: {"spreadsheetId": spreadsheetId,
+                                 **self._service.append_rows(range, body.get('values', []))})
+
+
+class _FakeSpreadsheets:
+    def __init__(self, service: 'FakeSheetsService'):
+        self._service = service
+
+    def values(self) -> _FakeValues:
+        return _FakeValues(self._service)
+
+
+class FakeSheetsService:
+    """In-memory spreadsheet grid behind the googleapiclient call shapes we use"""
+
+    def __init__(self, sheets: Optional[Dict[str, List[List[str]]]] = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        # Like a real spreadsheet, there is always at least one sheet
+        self.grid: Dict[str, List[List[str]]] = {name: [list(row) for row in rows]
+                                                  for name, rows in (sheets or {DEFAULT_SHEET: []}).items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls = Counter()
+        self.errors = Counter()
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_rows(cls, headers: List[str], data_rows: List[List[str]], sheet: str = DEFAULT_SHEET, **options):
+        return cls({sheet: [list(headers)] + [list(row) for row in data_rows]}, **options)
+
+    @classmethod
+    def from_snapshot(cls, path: str, sheet: str = DEFAULT_SHEET, **options):
+        """Seed the grid from a row_source snapshot (.csv, .xlsx or .json)"""
+        from row_source import SnapshotSource
+
+        headers, data_rows = SnapshotSource(path).read()
+        return cls.from_rows(headers, data_rows, sheet, **options)
+
+    def spreadsheets(self) -> _FakeSpreadsheets:
+        return _FakeSpreadsheets(self)
+
+    def _before_execute(self, method: str):
+        self.calls[method] += 1
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self._rng.uniform(0, self.jitter))
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.errors[method] += 1
+            kind = 'Read' if method == 'get' else 'Write'
+            raise FakeHttpError(429, f"Quota exceeded for quota metric '{kind} requests' "
+                                     f"and limit '{kind} requests per minute per user'")
+
+    def locate(self, range_name: str) -> Tuple[str, int, int, Optional[int], Optional[int]]:
+        """parse_a1() checked against the grid, answering like the real API
+
+        A bare sheet name ('Sheet1') is the whole sheet, a bare cell range ('A1:B2')
+        is on the first sheet, and an unknown sheet is a 400.
+        """
+        if '!' not in range_name:
+            name = range_name.strip("'")
+            if name in self.grid:
+                return name, 0, 0, None, None
+            # Anything else must be a cell ('B2') or a range with a colon, not a sheet name
+            if ':' not in name and not re.match(r'^[A-Za-z]+\d+$', name):
+                raise FakeHttpError(400, f"Unable to parse range: {range_name}")
+            sheet, first_row, first_col, last_row, last_col = parse_a1(range_name)
+            return next(iter(self.grid)), first_row, first_col, last_row, last_col
+
+        located = parse_a1(range_name)
+        if located[0] not in self.grid:
+            raise FakeHttpError(400, f"Unable to parse range: {range_name}")
+        return located
+
+    def read_range(self, range_name: str) -> Dict:
+        sheet, first_row, first_col, last_row, last_col = self.locate(range_name)
+        rows = self.grid[sheet]
+        stop_row = len(rows) if last_row is None else min(last_row + 1, len(rows))
+        stop_col = None if last_col is None else last_col + 1
+
+        values = [_trim(row[first_col:stop_col]) for row in rows[first_row:stop_row]]
+        while values and not values[-1]:
+            values.pop()
+
+        result = {"range": range_name if '!' in range_name or range_name.strip("'") == sheet
+                  else f"{sheet}!{range_name}", "majorDimension": "ROWS"}
+        if values:
+            result["values"] = values
+        return result
+
+    def write_range(self, range_name: str, values: List[List]) -> Dict:
+        sheet, first_row, first_col, last_row, last_col = self.locate(range_name)
+        height = len(values)
+        width = max((len(row) for row in values), default=0)
+        if (last_row is not None and first_row + height - 1 > last_row) or \
+                (last_col is not None and first_col + width - 1 > last_col):
+            raise FakeHttpError(400, f"Requested writing within range [{range_name}], "
+                                     f"but tried writing {height} rows x {width} columns")
+
+        rows = self.grid[sheet]
+        for r, row_values in enumerate(values):
+            while len(rows) <= first_row + r:
+                rows.append([])
+            row = rows[first_row + r]
+            if len(row) < first_col + len(row_values):
+                row.extend([''] * (first_col + len(row_values) - len(row)))
+            for c, value in enumerate(row_values):
+                row[first_col + c] = '' if value is None else str(value)
+
+        return {
+            "updatedRange": a1_range(sheet, first_row, first_col, first_row + max(height, 1) - 1,
+                                     first_col + max(width, 1) - 1),
+            "updatedRows": height,
+            "updatedColumns": width,
+            "updatedCells": sum(len(row) for row in values),
+        }
+
+    def append_rows(self, range_name: str, values: List[List]) -> Dict:
+        sheet, first_row, first_col, _, last_col = self.locate(range_name)
+        rows = self.grid[sheet]
+        stop_col = None if last_col is None else last_col + 1
+
+        # The "table" ends at the last row with data in the range's columns
+        end = len(rows)
+        while end > first_row and not _trim(rows[end - 1][first_col:stop_col]):
+            end -= 1
+        start = max(end, first_row)
+
+        width = max((len(row) for row in values), default=1)
+        table_range = a1_range(sheet, first_row, first_col, max(end - 1, first_row), first_col + width - 1)
+        if not values:
+            return {"tableRange": table_range, "updates": {"updatedRows": 0, "updatedColumns": 0, "updatedCells": 0}}
+        updates = self.write_range(a1_range(sheet, start, first_col, start + len(values) - 1,
+                                            first_col + width - 1), values)
+        return {"tableRange": table_range, "updates": updates}
+
+
+def fake_service_from_env() -> FakeSheetsService:
+    """The process-wide fake, seeded from GLOSSARY_FAKE_SHEETS_* settings"""
+    global _fake_service
+    if _fake_service is None:
+        options = {
+            "latency": float(os.environ.get(FAKE_LATENCY_ENV, 0) or 0),
+            "error_rate": float(os.environ.get(FAKE_ERROR_RATE_ENV, 0) or 0),
+            "seed": int(os.environ[FAKE_SEED_ENV]) if os.environ.get(FAKE_SEED_ENV) else None,
+        }
+        snapshot = os.environ.get(FAKE_SNAPSHOT_ENV)
+        _fake_service = (FakeSheetsService.from_snapshot(snapshot, **options) if snapshot
+                         else FakeSheetsService(**options))
+        print(f"🧪 Using in-process fake Google Sheets ({snapshot or 'empty grid'})")
+    return _fake_service
+
+
+def use_fake_service(service: Optional[FakeSheetsService]):
+    """Install a fake for every later build_sheets_service() call in this process (None clears it)"""
+    global _fake_service
+    _fake_service = service
+
+
+def build_sheets_service(credentials_file: str, scopes: List[str]):
+    """Sheets v4 service: the real API, or the in-process fake when GLOSSARY_SHEETS_BACKEND=fake
+    (or one was installed with use_fake_service)"""
+    if _fake_service is not None or os.environ.get(SHEETS_BACKEND_ENV, 'google').lower() == 'fake':
+        return fake_service_from_env()
+
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+
+    creds = Credentials.from_service_account_file(credentials_file, scopes=scopes)
+    return build('sheets', 'v4', credentials=creds)
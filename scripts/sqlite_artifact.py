@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+SQLite artifact built during export
+Normalized tables for terms, tags, categories and quiz questions, indexes on
+id/names/abbreviations, and an FTS5 table over description and instruction.
+Services open it read-only and query it instead of walking the JSON files.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, List
+
+from artifact_writer import replace_if_changed
+
+SQLITE_FILE = 'glossary.sqlite'
+
+SCHEMA = """
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE terms (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name_us TEXT NOT NULL,
+    name_uk TEXT,
+    abbreviation_us TEXT,
+    abbreviation_uk TEXT,
+    symbol TEXT,
+    category_id INTEGER REFERENCES categories(id),
+    description TEXT,
+    instruction TEXT,
+    difficulty TEXT,
+    status TEXT,
+    extra_json TEXT
+);
+CREATE INDEX terms_name_us ON terms (name_us COLLATE NOCASE);
+CREATE INDEX terms_name_uk ON terms (name_uk COLLATE NOCASE);
+CREATE INDEX terms_abbreviation_us ON terms (abbreviation_us COLLATE NOCASE);
+CREATE INDEX terms_abbreviation_uk ON terms (abbreviation_uk COLLATE NOCASE);
+CREATE INDEX terms_category ON terms (category_id);
+
+CREATE TABLE tags (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE term_tags (
+    term_rowid INTEGER NOT NULL REFERENCES terms(rowid),
+    tag_id INTEGER NOT NULL REFERENCES tags(id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (term_rowid, tag_id)
+) WITHOUT ROWID;
+CREATE INDEX term_tags_tag ON term_tags (tag_id, term_rowid);
+
+CREATE TABLE quiz_questions (
+    id TEXT PRIMARY KEY,
+    term_rowid INTEGER REFERENCES terms(rowid),
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    difficulty TEXT
+) WITHOUT ROWID;
+CREATE INDEX quiz_questions_term ON quiz_questions (term_rowid);
+
+CREATE VIRTUAL TABLE terms_fts USING fts5(
+    name_us, description, instruction,
+    content='terms', content_rowid='rowid',
+    tokenize='porter unicode61'
+);
+
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+# Term fields that get their own column; anything else goes to extra_json
+TERM_COLUMNS = ('id', 'name_us', 'name_uk', 'abbreviation_us', 'abbreviation_uk', 'symbol',
+                'description', 'instruction', 'difficulty', 'status')
+
+
+def build_sqlite(terms_data: List[Dict], quiz_questions: List[Dict] = (),
+                 filename: str = SQLITE_FILE, version: str = '1.0') -> int:
+    """Build glossary.sqlite from the term dicts create_api_files assembles; returns size"""
+    tmp_name = filename + '.tmp'
+    if os.path.exists(tmp_name):
+        os.remove(tmp_name)
+
+    conn = sqlite3.connect(tmp_name)
+    try:
+        conn.executescript(SCHEMA)
+
+        category_ids = {}
+        tag_ids = {}
+        rowids = {}
+        for term in terms_data:
+            category = term.get('category', '')
+            if category not in category_ids:
+                category_ids[category] = conn.execute(
+                    "INSERT INTO categories (name) VALUES (?)", (category,)).lastrowid
+
+            extra = {k: v for k, v in term.items()
+                     if k not in TERM_COLUMNS and k not in ('category', 'tags')}
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO terms (id, name_us, name_uk, abbreviation_us, abbreviation_uk, "
+                "symbol, category_id, description, instruction, difficulty, status, extra_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (term['id'], term.get('name_us', ''), term.get('name_uk', ''),
+                 term.get('abbreviation_us', ''), term.get('abbreviation_uk', ''),
+                 term.get('symbol', ''), category_ids[category],
+                 term.get('description', ''), term.get('instruction', ''),
+                 term.get('difficulty', ''), term.get('status', ''),
+                 json.dumps(extra, ensure_ascii=False) if extra else None))
+            if not cursor.rowcount:
+                print(f"⚠️  Skipping duplicate ID in sqlite artifact: {term['id']}")
+                continue
+            rowid = rowids[term['id']] = cursor.lastrowid
+
+            for position, tag in enumerate(dict.fromkeys(term.get('tags', []))):
+                if tag not in tag_ids:
+                    tag_ids[tag] = conn.execute("INSERT INTO tags (name) VALUES (?)", (tag,)).lastrowid
+                conn.execute("INSERT INTO term_tags VALUES (?, ?, ?)", (rowid, tag_ids[tag], position))
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO quiz_questions VALUES (?, ?, ?, ?, ?)",
+            [(q['id'], rowids.get(q.get('term_id')), q['question'], q.get('answer', q.get('correct_answer')),
+              q.get('difficulty', ''))
+             for q in quiz_questions])
+
+        conn.execute("INSERT INTO terms_fts (terms_fts) VALUES ('rebuild')")
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('version', version),
+            ('total_terms', str(len(rowids))),
+        ])
+        conn.commit()
+        conn.execute("INSERT INTO terms_fts (terms_fts) VALUES ('optimize')")
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    changed = replace_if_changed(tmp_name, filename)
+    size = os.path.getsize(filename)
+    print(f"{'✅ Created' if changed else '⏭️  Unchanged'} {filename} ({size} bytes)")
+    return size
+
+
+def open_readonly(filename: str = SQLITE_FILE, mmap_size: int = 64 * 1024 * 1024) -> sqlite3.Connection:
+    """Open the artifact read-only with memory-mapped I/O"""
+    path = os.path.abspath(filename)
+    conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+    conn.execute("PRAGMA query_only = 1")
+    return conn
+
+
+def get_term(conn: sqlite3.Connection, term_id: str):
+    """Fetch one term with its category and tags as a dict"""
+    row = conn.execute(
+        "SELECT t.*, c.name AS category FROM terms t JOIN categories c ON c.id = t.category_id "
+        "WHERE t.id = ?", (term_id,)).fetchone()
+    if row is None:
+        return None
+    term = dict(row)
+    term['tags'] = [r[0] for r in conn.execute(
+        "SELECT g.name FROM term_tags tt JOIN tags g ON g.id = tt.tag_id "
+        "WHERE tt.term_rowid = ? ORDER BY tt.position", (term.pop('rowid'),))]
+    del term['category_id']
+    extra = term.pop('extra_json')
+    if extra:
+        term.update(json.loads(extra))
+    return term
+
+
+def search_text(conn: sqlite3.Connection, query: str, limit: int = 10) -> List[Dict]:
+    """FTS5 search over names, descriptions and instructions, best match first"""
+    return [dict(row) for row in conn.execute(
+        "SELECT t.id, t.name_us, bm25(terms_fts) AS score FROM terms_fts "
+        "JOIN terms t ON t.rowid = terms_fts.rowid WHERE terms_fts MATCH ? "
+        "ORDER BY score LIMIT ?", (query, limit))]
+
+
+def main():
+    """Build a throwaway database from glossary.json and run sample queries"""
+    import tempfile
+
+    from glossary_index import load_glossary_terms
+
+    path = os.path.join(tempfile.mkdtemp(), SQLITE_FILE)
+    build_sqlite(load_glossary_terms('../glossary.json'), filename=path)
+
+    conn = open_readonly(path)
+    print(f"   SC → {get_term(conn, 'SC')['name_us']}")
+    for query in ['textured', 'magic ring', 'tunisian']:
+        matches = ', '.join(r['id'] for r in search_text(conn, query, 5))
+        print(f"   🔍 {query!r} → {matches}")
+
+
+if __name__ == "__main__":
+    main()
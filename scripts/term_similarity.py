@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Vectorized term similarity (similar.json)
+Each term becomes a TF-IDF vector of hashed character trigrams over its name,
+description, instruction and tags; nearest neighbours for every term come from
+batched matrix products instead of per-pair loops.
+NumPy is optional: install numpy to enable this artifact.
+"""
+
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SIMILARITY_FILE = 'similar.json'
+
+DEFAULT_K = 10
+N_FEATURES = 2 ** 11     # hashed trigram buckets; memory is terms × N_FEATURES × 4 bytes
+BATCH_SIZE = 512         # rows per matrix product; peak extra memory is BATCH_SIZE × terms
+
+# Field → weight (how many times its trigrams are counted)
+FIELD_WEIGHTS = {
+    'name_us': 3,
+    'name_uk': 1,
+    'description': 1,
+    'instruction': 2,
+    'tags': 2,
+}
+
+_WORD = re.compile(r'\w+')
+
+
+def term_text(term: Dict, field: str) -> str:
+    value = term.get(field, '')
+    return ' '.join(value) if isinstance(value, list) else str(value or '')
+
+
+def char_trigrams(text: str) -> List[str]:
+    """Trigrams inside word boundaries: 'sc st' → ' sc', 'sc ', ' st', 'st '"""
+    grams = []
+    for word in _WORD.findall(text.lower()):
+        padded = f" {word} "
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _bucket(gram: str, cache: Dict[str, int]) -> int:
+    # crc32 rather than hash(), so buckets don't change between runs
+    index = cache.get(gram)
+    if index is None:
+        index = cache[gram] = zlib.crc32(gram.encode('utf-8')) % N_FEATURES
+    return index
+
+
+def build_vectors(terms: List[Dict], field_weights: Dict[str, int] = FIELD_WEIGHTS):
+    """L2-normalized TF-IDF matrix (terms × N_FEATURES, float32)"""
+    # Accumulate only the non-zero (row, bucket) cells: a term touches a few hundred
+    # buckets, so weighting and normalizing never walk the dense terms × N_FEATURES grid
+    cache: Dict[str, int] = {}
+    rows, buckets, counts = [], [], []
+    for row, term in enumerate(terms):
+        cells: Dict[int, int] = {}
+        for field, weight in field_weights.items():
+            for gram, count in Counter(char_trigrams(term_text(term, field))).items():
+                bucket = _bucket(gram, cache)
+                cells[bucket] = cells.get(bucket, 0) + weight * count
+        rows.extend([row] * len(cells))
+        buckets.extend(cells)
+        counts.extend(cells.values())
+    rows = np.array(rows, dtype=np.int64)
+    buckets = np.array(buckets, dtype=np.int64)
+
+    document_frequency = np.bincount(buckets, minlength=N_FEATURES)
+    idf = np.log((1 + len(terms)) / (1 + document_frequency)).astype(np.float32) + 1
+    values = (1 + np.log(np.array(counts, dtype=np.float32))) * idf[buckets]
+    norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(terms))).astype(np.float32)
+    values /= norms[rows]
+
+    vectors = np.zeros((len(terms), N_FEATURES), dtype=np.float32)
+    vectors[rows, buckets] = values
+    return vectors
+
+
+def nearest_neighbours(terms: List[Dict], k: int = DEFAULT_K,
+                       batch_size: int = BATCH_SIZE) -> Dict[str, List[List]]:
+    """{id: [[neighbour id, cosine similarity], ...]} with the k most similar other terms"""
+    unique = {}
+    for term in terms:
+        if term.get('id'):
+            unique.setdefault(term['id'], term)
+    ids = list(unique)
+    if np is None or len(ids) < 2:
+        return {}
+
+    vectors = build_vectors(list(unique.values()))
+    k = min(k, len(ids) - 1)
+    neighbours = {}
+    for start in range(0, len(ids), batch_size):
+        stop = min(start + batch_size, len(ids))
+        scores = vectors[start:stop] @ vectors.T
+        scores[np.arange(stop - start), np.arange(start, stop)] = -np.inf   # not its own neighbour
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        # Best first; ties broken by glossary order so the output is stable
+        order = np.lexsort((top, -top_scores), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        for offset, (columns, values) in enumerate(zip(top.tolist(), top_scores.tolist())):
+            neighbours[ids[start + offset]] = [[ids[col], round(score, 4)]
+                                               for col, score in zip(columns, values) if score > 0]
+    return neighbours
+
+
+def build_similarity(terms: List[Dict], k: int = DEFAULT_K) -> Optional[Dict]:
+    """similar.json payload, or None when NumPy is not installed"""
+    if np is None:
+        print("⚠️  Skipping similar.json (pip install numpy)")
+        return None
+    return {
+        "version": "1.0",
+        "method": "tf-idf over hashed character trigrams, cosine similarity",
+        "fields": FIELD_WEIGHTS,
+        "k": k,
+        "neighbours": nearest_neighbours(terms, k),
+    }
+
+
+def related_ids(similarity: Dict, term_id: str, limit: int = DEFAULT_K) -> List[str]:
+    """Neighbour IDs of a term from a loaded similar.json, most similar first"""
+    return [neighbour for neighbour, _ in similarity.get("neighbours", {}).get(term_id, [])[:limit]]
+
+
+def main():
+    """Show neighbours for a few terms and time a synthetic 10k-term build"""
+    import random
+    import time
+
+    from glossary_index import load_glossary_terms
+
+    if np is None:
+        print("❌ NumPy is not installed (pip install numpy)")
+        return
+
+    terms = load_glossary_terms('../glossary.json')
+    neighbours = nearest_neighbours(terms, 5)
+    for term_id in ('SC', 'DC', 'MR'):
+        if term_id in neighbours:
+            print(f"   {term_id} → {', '.join(f'{n} ({s:.2f})' for n, s in neighbours[term_id])}")
+
+    rng = random.Random(0)
+    words = [term_text(t, 'description') for t in terms]
+    synthetic = [{"id": f"T{i}", "name_us": f"Stitch {i}", "description": rng.choice(words),
+                  "tags": rng.sample(['basic', 'texture', 'lace', 'tool', 'yarn', 'join'], 2)}
+                 for i in range(10000)]
+    start = time.perf_counter()
+    nearest_neighbours(synthetic, DEFAULT_K)
+    print(f"   10,000 terms: top-{DEFAULT_K} neighbours in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
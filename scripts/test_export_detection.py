@@ -9,6 +9,7 @@ Run this AFTER running your modified export_from_sheets.py
 import json
 import os
 from datetime import datetime
+from glossary_index import GlossaryIndex
 
 def test_auto_detection():
     """Test the auto-detection export results"""
@@ -154,15 +155,13 @@ def check_beginner_stitches():
     print(f"\n🎯 BEGINNER STITCH CHECK:")
     
     try:
-        with open('../glossary.json', 'r') as f:
-            api_data = json.load(f)
-        terms = api_data.get('terms', [])
+        index = GlossaryIndex.from_file('../glossary.json')
         
         # Check for essential beginner stitches
         beginner_stitches = ['SC', 'DC', 'HDC', 'CH', 'SLST', 'SN']
         
         for stitch_id in beginner_stitches:
-            term = next((t for t in terms if t.get('id') == stitch_id), None)
+            term = index.get(stitch_id)
             if term:
                 difficulty = term.get('difficulty', 'Unknown')
                 tags = term.get('tags', [])
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Fuzzy search regression checks
+Typos must reach the edit-distance check instead of being dropped by the
+trigram candidate filter
+"""
+
+from fuzzy_search import FuzzySearch, bounded_edit_distance
+
+TERMS = [
+    {"id": "CH", "name_us": "Chain", "name_uk": "Chain", "priority": "High"},
+    {"id": "SC", "name_us": "Single Crochet", "name_uk": "Double Crochet", "priority": "High"},
+    {"id": "TSS", "name_us": "Tunisian Simple Stitch", "name_uk": "Tunisian Simple Stitch"},
+]
+
+
+def search_ids(engine, query):
+    return [term['id'] for term, _ in engine.search(query)]
+
+
+def test_transposed_letters():
+    """Swaps at the end and in the middle of a word are one typo"""
+    engine = FuzzySearch(TERMS)
+    assert bounded_edit_distance('chian', 'chain', 1) == 1
+    assert search_ids(engine, 'singel') == ['SC']
+    assert search_ids(engine, 'chian') == ['CH']
+    assert search_ids(engine, 'crohcet') == ['SC']
+    assert search_ids(engine, 'tunisain') == ['TSS']
+
+
+if __name__ == "__main__":
+    test_transposed_letters()
+    print("✅ Fuzzy search checks passed")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Quiz stream regression checks
+A stream serves every matching question once before any question repeats,
+including small question types and weighted type mixes
+"""
+
+from itertools import islice
+
+from quiz_stream import QuestionPool
+
+TERMS = [
+    {"id": f"T{i}", "name_us": f"Stitch {i}", "name_uk": f"Stitch {i}" if i % 3 else f"UK Stitch {i}",
+     "abbreviation_us": f"st{i}", "category": "Basic", "difficulty": "Beginner",
+     "description": f"Description {i}", "instruction": f"Instruction {i}"}
+    for i in range(12)
+] + [
+    {"id": "SYM", "name_us": "Symbol Stitch", "symbol": "+", "category": "Basic"},
+    {"id": "T0", "name_us": "Duplicate ID", "description": "Never served"},
+]
+
+
+def question_keys(pool, count, **filters):
+    return [(q['type'], q['term_id']) for q in islice(pool.stream(seed=1, **filters), count)]
+
+
+def test_no_repeats_within_a_pass():
+    """The first pass holds each matching (type, term) once; the next pass starts over"""
+    pool = QuestionPool(TERMS)
+    assert len(pool.terms) == 13
+    for types in (None, ['symbol', 'terminology', 'definition'], {'symbol': 50, 'terminology': 1}):
+        total = sum(pool.size(types=types).values())
+        keys = question_keys(pool, total * 2, types=types)
+        assert len(set(keys[:total])) == total, types
+        assert set(keys[total:]) == set(keys[:total]), types
+
+
+def test_duplicate_ids_keep_the_first_term():
+    """Later terms reusing an ID are ignored"""
+    pool = QuestionPool(TERMS)
+    answers = {q['answer'] for q in islice(pool.stream(types=['definition'], seed=1), 20)}
+    assert "Duplicate ID" not in answers
+    assert "Stitch 0" in answers
+
+
+if __name__ == "__main__":
+    test_no_repeats_within_a_pass()
+    test_duplicate_ids_keep_the_first_term()
+    print("✅ Quiz stream checks passed")
@@ -4,10 +4,9 @@ DANI'S Glossary - Star Rating Updater for GitHub Codespaces
 Simple, focused script for updating difficulty star ratings on 301+ terms
 """
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 import json
 import os
+from sheets_service import build_sheets_service
 
 def check_for_new_terms():
     """Check if there are new terms since last analysis"""
@@ -43,9 +42,7 @@ CREDENTIALS_FILE = 'credentials.json'
 def get_sheets_service():
     """Initialize Google Sheets connection for Codespaces"""
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            CREDENTIALS_FILE, scopes=SCOPES)
-        service = build('sheets', 'v4', credentials=creds)
+        service = build_sheets_service(CREDENTIALS_FILE, SCOPES)
         return service.spreadsheets()
     except Exception as e:
         print(f"❌ Error connecting to Google Sheets: {e}")
@@ -6,8 +6,7 @@ Copy/paste new term data as needed
 
 import json
 import os
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from sheets_service import build_sheets_service
 
 # Configuration
 SPREADSHEET_ID = '1WXt17J7Bn7nuRG3SV1HvvoWX4mvgZmY7dAeLRIlIh3A'
@@ -21,8 +20,7 @@ def update_glossary_terms():
     """Add new terms to the crochet glossary - UPDATE THE new_terms LIST BELOW"""
     
     # Load credentials
-    creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
-    service = build('sheets', 'v4', credentials=creds)
+    service = build_sheets_service(CREDENTIALS_FILE, SCOPES)
     sheet = service.spreadsheets()
     
     # ========================================